@@ -6,50 +6,96 @@ This script automates the process of creating standalone executables
 for both the CLI and GUI versions of the WSL Manager application.
 """
 
+import argparse
+import hashlib
+import io
+import json
 import os
 import sys
 import subprocess
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Run as a script, so this directory is on sys.path
+from copy_utils import fast_copy
+
+
+# The project root directory (parent of build_scripts)
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Resolve the PyInstaller launcher once; fall back to running it as a module
+_PYINSTALLER_EXE = shutil.which("pyinstaller")
+PYINSTALLER = [_PYINSTALLER_EXE] if _PYINSTALLER_EXE else [sys.executable, "-m", "PyInstaller"]
+
+# Arguments shared by both PyInstaller builds
+PYINSTALLER_ARGS = ["--noconfirm", "--workpath", "build", "--distpath", "dist"]
+
+# Files that feed the executables (along with the package sources and its
+# assets); a build is skipped when none have changed. icon.ico is embedded
+# by both builds, so regenerating it with create_icon.py forces a rebuild.
+BUILD_INPUTS = ['main.py', 'gui.py', 'icon.ico', 'build_scripts/wsl_manager_cli.spec',
+                'build_scripts/wsl_manager_gui.spec']
+BUILD_OUTPUTS = ['dist/WSLManager.exe', 'dist/WSLManagerGUI.exe']
+BUILD_CACHE_FILE = Path('.build-cache/last.json')
+
+# Build output removed by clean_build_dirs (build/ is kept for PyInstaller's cache)
+_DIRS_TO_CLEAN = ('dist',)
+
+# Directories never searched for __pycache__ when cleaning
+_CLEAN_SKIP_DIRS = frozenset({'.git', '.venv', 'venv', 'node_modules', 'build', 'dist'})
+
 
 def run_command(command, description, cwd=None):
-    """Run a command and handle errors."""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Command: {command}")
+    """Run a command (an argument list) and handle errors.
+    
+    The command's output goes to a temporary file rather than into memory and
+    is only shown if the command fails. Status lines are collected per call
+    and printed once the command finishes, so commands running in parallel
+    don't interleave their output.
+    """
+    out = io.StringIO()
+    out.write(f"\n{'='*60}\n")
+    out.write(f"Running: {description}\n")
+    out.write(f"Command: {subprocess.list2cmdline(command)}\n")
     if cwd:
-        print(f"Working directory: {cwd}")
-    print('='*60)
+        out.write(f"Working directory: {cwd}\n")
+    out.write('='*60 + "\n")
     
-    try:
-        # Use CREATE_NO_WINDOW on Windows to suppress console windows
-        kwargs = {}
-        if sys.platform == "win32":
-            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-        
-        result = subprocess.run(command, shell=True, check=True, 
-                              capture_output=True, text=True, cwd=cwd, **kwargs)
-        print("✓ Success!")
-        if result.stdout:
-            print("Output:", result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Error: {e}")
-        if e.stdout:
-            print("Output:", e.stdout)
-        if e.stderr:
-            print("Error:", e.stderr)
-        return False
+    # Use CREATE_NO_WINDOW on Windows to suppress console windows
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+    
+    with tempfile.TemporaryFile() as log:
+        try:
+            subprocess.run(command, check=True, stdout=log,
+                           stderr=subprocess.STDOUT, cwd=cwd, **kwargs)
+            out.write("✓ Success!\n")
+            return True
+        except subprocess.CalledProcessError as e:
+            out.write(f"✗ Error: {e}\n")
+            log.seek(0)
+            output = log.read().decode(errors='replace')
+            if output:
+                out.write(f"Output: {output}\n")
+            return False
+        finally:
+            print(out.getvalue(), end="")
 
 
 def check_pyinstaller():
     """Check if PyInstaller is installed."""
+    # Ask a child interpreter for the version rather than importing PyInstaller
+    # here, so its modules don't stay loaded in this process for the whole build
     try:
-        import PyInstaller
-        print(f"✓ PyInstaller {PyInstaller.__version__} is installed")
+        result = subprocess.run([sys.executable, "-m", "PyInstaller", "--version"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, check=True, timeout=5)
+        print(f"✓ PyInstaller {result.stdout.strip()} is installed")
         return True
-    except ImportError:
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
         print("✗ PyInstaller is not installed")
         return False
 
@@ -57,30 +103,32 @@ def check_pyinstaller():
 def install_pyinstaller():
     """Install PyInstaller."""
     print("\nInstalling PyInstaller...")
-    return run_command("pip install pyinstaller", "Installing PyInstaller")
+    return run_command([sys.executable, "-m", "pip", "install", "pyinstaller"],
+                       "Installing PyInstaller")
 
 
 def clean_build_dirs():
-    """Clean previous build directories."""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
+    """Clean previous build output and Python bytecode caches.
     
-    for dir_name in dirs_to_clean:
+    The PyInstaller work directory (build/) is kept so its analysis cache
+    can be reused by incremental builds.
+    """
+    for dir_name in _DIRS_TO_CLEAN:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name} directory...")
             shutil.rmtree(dir_name)
     
-    # Clean .pyc files
+    # .pyc files only live in __pycache__, so remove those directories whole
+    # instead of checking every file, and don't descend into unrelated trees
     for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.pyc'):
-                os.remove(os.path.join(root, file))
+        if '__pycache__' in dirs:
+            shutil.rmtree(os.path.join(root, '__pycache__'), ignore_errors=True)
+        dirs[:] = [d for d in dirs if d not in _CLEAN_SKIP_DIRS and d != '__pycache__']
 
 
 def check_icon_file():
     """Check if icon file exists and warn if not."""
-    # Get the project root directory (parent of build_scripts)
-    project_root = Path(__file__).parent.parent
-    icon_path = project_root / "icon.ico"
+    icon_path = PROJECT_ROOT / "icon.ico"
     if not icon_path.exists():
         print("⚠️  Warning: icon.ico not found")
         print("   Your executables will use the default Python icon")
@@ -94,32 +142,87 @@ def check_icon_file():
         return True
 
 
-def build_cli():
-    """Build the CLI executable."""
-    print("\n" + "="*60)
-    print("Building CLI Executable")
-    print("="*60)
+def prepare_build(install, clean):
+    """Install PyInstaller and clean previous builds, overlapping the two.
     
-    check_icon_file()
-    
-    # Get the project root directory (parent of build_scripts)
-    project_root = Path(__file__).parent.parent
-    command = "python -m PyInstaller build_scripts/wsl_manager_cli.spec"
-    return run_command(command, "Building CLI executable", cwd=project_root)
+    The pip install is network-bound, so the local cleanup runs alongside it.
+    Returns False if PyInstaller could not be installed.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        installed = executor.submit(install_pyinstaller) if install else None
+        # Clean previous builds (build/ is kept for incremental rebuilds)
+        if clean:
+            clean_build_dirs()
+        return installed is None or installed.result()
+
+
+def _inputs_hash():
+    """Hash the contents of every file that goes into the executables."""
+    h = hashlib.blake2b(digest_size=16)
+    paths = ([Path(p) for p in BUILD_INPUTS] + sorted(Path('wsl_manager').rglob('*.py'))
+             + sorted(Path('wsl_manager/assets').rglob('*')))
+    for path in paths:
+        if path.is_file():
+            h.update(str(path).encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _output_mtimes():
+    """Return the modification times of the built executables, or None if any are missing."""
+    try:
+        return {p: os.stat(p).st_mtime_ns for p in BUILD_OUTPUTS}
+    except FileNotFoundError:
+        return None
+
+
+def builds_up_to_date(inputs_hash):
+    """Check whether the last successful build used the same inputs."""
+    try:
+        last = json.loads(BUILD_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    mtimes = _output_mtimes()
+    return mtimes is not None and last == {'hash': inputs_hash, 'mtime_dist': mtimes}
+
+
+def save_build_cache(inputs_hash):
+    """Record the inputs of a successful build."""
+    BUILD_CACHE_FILE.parent.mkdir(exist_ok=True)
+    BUILD_CACHE_FILE.write_text(json.dumps({'hash': inputs_hash, 'mtime_dist': _output_mtimes()}))
+
+
+def build_cli():
+    """Return the command that builds the CLI executable."""
+    return PYINSTALLER + PYINSTALLER_ARGS + ["build_scripts/wsl_manager_cli.spec"]
 
 
 def build_gui():
-    """Build the GUI executable."""
+    """Return the command that builds the GUI executable."""
+    return PYINSTALLER + PYINSTALLER_ARGS + ["build_scripts/wsl_manager_gui.spec"]
+
+
+def build_executables():
+    """Build the CLI and GUI executables in parallel.
+    
+    Returns a (cli_success, gui_success) tuple.
+    """
     print("\n" + "="*60)
-    print("Building GUI Executable")
+    print("Building CLI and GUI Executables")
     print("="*60)
     
-    check_icon_file()
+    builds = [
+        (build_cli(), "Building CLI executable"),
+        (build_gui(), "Building GUI executable"),
+    ]
     
-    # Get the project root directory (parent of build_scripts)
-    project_root = Path(__file__).parent.parent
-    command = "python -m PyInstaller build_scripts/wsl_manager_gui.spec"
-    return run_command(command, "Building GUI executable", cwd=project_root)
+    # Each build is a separate PyInstaller process, so threads are enough
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cli_success, gui_success = executor.map(
+            lambda build: run_command(*build, cwd=PROJECT_ROOT), builds
+        )
+    
+    return cli_success, gui_success
 
 
 def create_release_package():
@@ -145,7 +248,7 @@ def create_release_package():
     
     if cli_exe.exists():
         try:
-            shutil.copy2(cli_exe, release_dir / "WSLManager.exe")
+            fast_copy(cli_exe, release_dir / "WSLManager.exe")
             print(f"✓ Copied {cli_exe} to release/")
         except PermissionError as e:
             print(f"⚠️  Warning: Could not copy CLI executable: {e}")
@@ -155,7 +258,7 @@ def create_release_package():
     
     if gui_exe.exists():
         try:
-            shutil.copy2(gui_exe, release_dir / "WSLManagerGUI.exe")
+            fast_copy(gui_exe, release_dir / "WSLManagerGUI.exe")
             print(f"✓ Copied {gui_exe} to release/")
         except PermissionError as e:
             print(f"⚠️  Warning: Could not copy GUI executable: {e}")
@@ -196,15 +299,27 @@ These executables are standalone and include all necessary dependencies.
 They should work on any Windows system with WSL support.
 """
     
-    with open(release_dir / "README.txt", "w") as f:
-        f.write(readme_content)
+    (release_dir / "README.txt").write_bytes(readme_content.encode('utf-8'))
     
     print("✓ Created release README.txt")
     print(f"✓ Release package created in: {release_dir.absolute()}")
 
 
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Build WSL Manager executables")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="delete the dist directory and rebuild even if nothing changed",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main build function."""
+    args = parse_args()
+    
     print("WSL Manager - Executable Builder")
     print("="*60)
     
@@ -214,22 +329,29 @@ def main():
         print("Required files: main.py, gui.py")
         sys.exit(1)
     
-    # Check/install PyInstaller
-    if not check_pyinstaller():
-        if not install_pyinstaller():
+    # Check the icon once here rather than from each build; the spec files
+    # fall back to the default icon on their own when it's missing
+    icon_ok = check_icon_file()
+    
+    inputs_hash = _inputs_hash()
+    if not args.fresh and builds_up_to_date(inputs_hash):
+        # Nothing changed since the last successful build
+        print("✓ Executables are up to date")
+        cli_success = gui_success = True
+    else:
+        if not prepare_build(install=not check_pyinstaller(), clean=args.fresh):
             print("✗ Failed to install PyInstaller")
             sys.exit(1)
-    
-    # Clean previous builds
-    clean_build_dirs()
-    
-    # Build executables
-    cli_success = build_cli()
-    gui_success = build_gui()
-    
-    if not cli_success and not gui_success:
-        print("\n✗ All builds failed!")
-        sys.exit(1)
+        
+        # Build executables
+        cli_success, gui_success = build_executables()
+        
+        if not cli_success and not gui_success:
+            print("\n✗ All builds failed!")
+            sys.exit(1)
+        
+        if cli_success and gui_success:
+            save_build_cache(inputs_hash)
     
     # Create release package
     create_release_package()
@@ -242,6 +364,8 @@ def main():
         print("✓ CLI executable: dist/WSLManager.exe")
     if gui_success:
         print("✓ GUI executable: dist/WSLManagerGUI.exe")
+    if not icon_ok:
+        print("⚠️  Executables were built without a custom icon")
     
     print("✓ Release package: release/")
     print("\nYou can now distribute the files from the 'release' directory.")
@@ -0,0 +1,102 @@
+"""
+File copying for the build and release scripts
+
+Copies the executables into the release folder using the platform's native
+copy where there is one.
+"""
+
+import errno
+import io
+import os
+import shutil
+import sys
+
+# Buffer size used when copying executables (PyInstaller one-file builds are
+# tens of MiB, so a large buffer keeps the number of read/write calls low)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Errors meaning the kernel can't do the copy for this pair of files
+_KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL}
+
+
+def _load_copy_file2():
+    """Return kernel32's CopyFile2 with its signature declared, or None
+    before Windows 8.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        copy_file2 = ctypes.windll.kernel32.CopyFile2
+    except (ImportError, AttributeError):
+        return None
+    # HRESULT CopyFile2(PCWSTR, PCWSTR, COPYFILE2_EXTENDED_PARAMETERS *);
+    # an HRESULT restype makes a failure raise OSError
+    copy_file2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+    copy_file2.restype = ctypes.HRESULT
+    return copy_file2
+
+
+def _windows_fast_copy(src, dst) -> bool:
+    """Copy src to dst with CopyFile2, which also copies the metadata.
+    
+    Returns False if CopyFile2 isn't available or fails, so the caller can
+    fall back to a regular buffered copy.
+    """
+    copy_file2 = _load_copy_file2()
+    if copy_file2 is None:
+        return False
+    try:
+        copy_file2(str(src), str(dst), None)
+    except OSError:
+        return False
+    return True
+
+
+def _linux_fast_copy(src, dst) -> bool:
+    """Copy src to dst inside the kernel (copy_file_range, then sendfile).
+    
+    Returns False if neither call is supported so the caller can fall back
+    to a regular buffered copy.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        
+        # copy_file_range can reflink on CoW filesystems and copy server-side on NFS
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(src_fd, dst_fd, 2 ** 30):
+                    pass
+                return True
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+        
+        try:
+            while os.sendfile(dst_fd, src_fd, None, COPY_BUFFER_SIZE):
+                pass
+            return True
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    
+    return False
+
+
+def fast_copy(src, dst):
+    """Copy src to dst along with its metadata, like shutil.copy2."""
+    if sys.platform == "win32" and _windows_fast_copy(src, dst):
+        return
+    if sys.platform.startswith("linux") and _linux_fast_copy(src, dst):
+        shutil.copystat(src, dst)
+        return
+    
+    # Copy through one reusable buffer using unbuffered file objects, since
+    # the buffer is already the unit of transfer
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with io.FileIO(src, 'r') as fsrc, io.FileIO(dst, 'w') as fdst:
+        while n := fsrc.readinto(buf):
+            written = 0
+            while written < n:
+                written += fdst.write(view[written:n])
+    shutil.copystat(src, dst)
@@ -6,22 +6,89 @@ This script helps create a simple icon file for the WSL Manager application.
 It creates a basic icon using Python's built-in libraries.
 """
 
+import functools
+import hashlib
 import os
 from pathlib import Path
 
-def create_simple_icon():
-    """Create a simple icon file using PIL if available, or provide instructions."""
+# Bump when the icon pipeline changes so cached icons are regenerated
+ICON_CACHE_VERSION = "2"
+ICON_CACHE_FILE = Path(".icon.cache")
+
+# Source images picked up from the current directory, in order of preference
+_ICON_SOURCES = ('icon.png', 'icon.jpg', 'icon.jpeg', 'penguin.png', 'penguin.jpg')
+
+# Frame sizes written to the ICO file; the last one is the master image size
+_ICO_SIZES = ((16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256))
+
+
+def _icon_inputs_hash(source_image):
+    """Hash the icon inputs (source image bytes and pipeline version)."""
+    h = hashlib.blake2b(digest_size=16)
+    if source_image:
+        h.update(Path(source_image).read_bytes())
+    h.update(ICON_CACHE_VERSION.encode())
+    return h.hexdigest()
+
+
+def _icon_up_to_date(icon_path, inputs_hash):
+    """Check whether icon_path was generated from the given inputs."""
+    try:
+        cached_hash, cached_mtime = ICON_CACHE_FILE.read_text().split()
+        return cached_hash == inputs_hash and icon_path.stat().st_mtime_ns == int(cached_mtime)
+    except (OSError, ValueError):
+        return False
+
+
+def _write_icon_cache(icon_path, inputs_hash):
+    """Record the inputs used to generate icon_path."""
+    tmp_path = ICON_CACHE_FILE.with_suffix(".tmp")
+    tmp_path.write_text(f"{inputs_hash} {icon_path.stat().st_mtime_ns}\n")
+    os.replace(tmp_path, ICON_CACHE_FILE)
+
+
+# System fonts to try, in order, before falling back to Pillow's default font
+FONT_CANDIDATES = ("arial.ttf", "segoeui.ttf", "DejaVuSans.ttf")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_font(size, names=FONT_CANDIDATES):
+    """Load the first available TrueType font from names at the given size."""
+    from PIL import ImageFont
+    
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _list_cwd_files():
+    """Return the files in the current directory, keyed by lower-cased name."""
+    with os.scandir('.') as entries:
+        return {entry.name.lower(): entry.name for entry in entries if entry.is_file()}
+
+
+def create_simple_icon(cwd_files=None):
+    """Create a simple icon file using PIL if available, or provide instructions.
+    
+    cwd_files is an optional result of _list_cwd_files() to reuse.
+    """
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
         
         # Check if user has provided an icon image
-        icon_sources = ['icon.png', 'icon.jpg', 'icon.jpeg', 'penguin.png', 'penguin.jpg']
-        source_image = None
+        if cwd_files is None:
+            cwd_files = _list_cwd_files()
+        source_image = next((cwd_files[source] for source in _ICON_SOURCES if source in cwd_files), None)
         
-        for source in icon_sources:
-            if Path(source).exists():
-                source_image = source
-                break
+        # Skip the whole Pillow pipeline if nothing changed since the last run
+        icon_path = Path("icon.ico")
+        inputs_hash = _icon_inputs_hash(source_image)
+        if _icon_up_to_date(icon_path, inputs_hash):
+            print(f"✓ {icon_path} up to date")
+            return True
         
         if source_image:
             # Use the provided image
@@ -48,13 +115,7 @@ def create_simple_icon():
                         fill=(0, 120, 215, 255), outline=(0, 80, 180, 255), width=4)
             
             # Draw "WSL" text
-            try:
-                # Try to use a system font
-                font_size = 60
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                # Fallback to default font
-                font = ImageFont.load_default()
+            font = _get_font(60)
             
             text = "WSL"
             bbox = draw.textbbox((0, 0), text, font=font)
@@ -66,9 +127,13 @@ def create_simple_icon():
             
             draw.text((x, y), text, fill=(255, 255, 255, 255), font=font)
         
+        # Render each smaller size once with LANCZOS and hand the frames to the
+        # ICO encoder, so Pillow doesn't resample the 256x256 master itself
+        mips = [img.resize(size, Image.Resampling.LANCZOS) for size in _ICO_SIZES[:-1]]
+        
         # Save as ICO file
-        icon_path = Path("icon.ico")
-        img.save(icon_path, format='ICO', sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
+        img.save(icon_path, format='ICO', sizes=_ICO_SIZES, append_images=mips)
+        _write_icon_cache(icon_path, inputs_hash)
         
         print(f"✓ Created icon file: {icon_path}")
         if source_image:
@@ -124,8 +189,11 @@ def main():
     print("WSL Manager - Icon Creation Helper")
     print("="*60)
     
+    # List the directory once for both the existing icon and the source images
+    cwd_files = _list_cwd_files()
+    
     # Check if icon already exists
-    if Path("icon.ico").exists():
+    if "icon.ico" in cwd_files:
         print("✓ Icon file already exists: icon.ico")
         response = input("Do you want to recreate it? (y/N): ").lower()
         if response != 'y':
@@ -133,7 +201,7 @@ def main():
             return
     
     # Try to create icon
-    if create_simple_icon():
+    if create_simple_icon(cwd_files):
         print("\n✓ Icon created successfully!")
         print("  You can now build your executables with the custom icon.")
     else:
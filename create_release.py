@@ -6,6 +6,8 @@ Simple script to create the release package from existing executables.
 import shutil
 from pathlib import Path
 
+from build_scripts.copy_utils import fast_copy
+
 def create_release_package():
     """Create a release package with both executables."""
     print("Creating Release Package...")
@@ -30,7 +32,7 @@ def create_release_package():
     
     if cli_exe.exists():
         try:
-            shutil.copy2(cli_exe, release_dir / "WSLManager.exe")
+            fast_copy(cli_exe, release_dir / "WSLManager.exe")
             print(f"✓ Copied {cli_exe} to release/")
             success_count += 1
         except PermissionError as e:
@@ -41,7 +43,7 @@ def create_release_package():
     
     if gui_exe.exists():
         try:
-            shutil.copy2(gui_exe, release_dir / "WSLManagerGUI.exe")
+            fast_copy(gui_exe, release_dir / "WSLManagerGUI.exe")
             print(f"✓ Copied {gui_exe} to release/")
             success_count += 1
         except PermissionError as e:
@@ -85,8 +87,7 @@ For issues or questions, please refer to the main project documentation.
     
     readme_path = release_dir / "README.txt"
     try:
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        readme_path.write_bytes(readme_content.encode('utf-8'))
         print(f"✓ Created {readme_path}")
     except Exception as e:
         print(f"⚠️  Warning: Could not create README.txt: {e}")
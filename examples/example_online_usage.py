@@ -8,12 +8,12 @@ about available WSL distributions that can be installed.
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from wsl_online_parser import WSLOnlineParser
 
 def main():
     """Example usage of the WSL online parser."""
+    # Imported here so that importing this module stays cheap
+    from wsl_manager import WSLOnlineParser
+    
     # Create a parser instance
     parser = WSLOnlineParser()
     
@@ -25,30 +25,31 @@ def main():
         print(f"Total distributions available: {len(distributions)}")
         print()
         
-        # Print each distribution
+        # Print each distribution (built up first and written in one go)
+        lines = []
         for i, dist in enumerate(distributions, 1):
-            print(f"Distribution {i}:")
-            print(f"  Name: {dist.name}")
-            print(f"  Friendly Name: {dist.friendly_name}")
-            print(f"  Install Command: wsl --install {dist.name}")
-            print()
+            lines.append(f"Distribution {i}:\n"
+                         f"  Name: {dist.name}\n"
+                         f"  Friendly Name: {dist.friendly_name}\n"
+                         f"  Install Command: wsl --install {dist.name}\n\n")
+        sys.stdout.write("".join(lines))
         
-        # Get specific information
+        # Get specific information. The category, search and lookup helpers
+        # below all work on the list fetched above, so 'wsl --list --online'
+        # only runs once; reuse the same parser instead of creating new ones.
         print("=== Distribution Categories ===")
         
         # Get Ubuntu distributions
         ubuntu_dists = parser.get_ubuntu_distributions()
-        print(f"Ubuntu distributions ({len(ubuntu_dists)}):")
-        for dist in ubuntu_dists:
-            print(f"  - {dist.name}: {dist.friendly_name}")
-        print()
+        lines = [f"Ubuntu distributions ({len(ubuntu_dists)}):"]
+        lines.extend(f"  - {dist.name}: {dist.friendly_name}" for dist in ubuntu_dists)
+        sys.stdout.write("\n".join(lines) + "\n\n")
         
         # Get enterprise distributions
         enterprise_dists = parser.get_enterprise_distributions()
-        print(f"Enterprise distributions ({len(enterprise_dists)}):")
-        for dist in enterprise_dists:
-            print(f"  - {dist.name}: {dist.friendly_name}")
-        print()
+        lines = [f"Enterprise distributions ({len(enterprise_dists)}):"]
+        lines.extend(f"  - {dist.name}: {dist.friendly_name}" for dist in enterprise_dists)
+        sys.stdout.write("\n".join(lines) + "\n\n")
         
         # Search for specific distributions
         print("=== Search Examples ===")
@@ -87,11 +88,13 @@ def main():
         
         # Get JSON output
         print("\n=== JSON Output ===")
-        json_output = parser.to_json()
-        print(json_output)
+        parser.to_json_stream(sys.stdout)
+        print()
         
     except Exception as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    # Make the wsl_manager package importable when run from a source checkout
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     main()
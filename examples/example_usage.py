@@ -8,12 +8,12 @@ about WSL distributions.
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from wsl_parser import WSLParser
 
 def main():
     """Example usage of the WSL parser."""
+    # Imported here so that importing this module stays cheap
+    from wsl_manager import WSLParser
+    
     # Create a parser instance
     parser = WSLParser()
     
@@ -25,14 +25,15 @@ def main():
         print(f"Total distributions found: {len(distributions)}")
         print()
         
-        # Print each distribution
+        # Print each distribution (built up first and written in one go)
+        lines = []
         for i, dist in enumerate(distributions, 1):
-            print(f"Distribution {i}:")
-            print(f"  Name: {dist.name}")
-            print(f"  State: {dist.state}")
-            print(f"  Version: {dist.version}")
-            print(f"  Is Default: {dist.is_default}")
-            print()
+            lines.append(f"Distribution {i}:\n"
+                         f"  Name: {dist.name}\n"
+                         f"  State: {dist.state}\n"
+                         f"  Version: {dist.version}\n"
+                         f"  Is Default: {dist.is_default}\n\n")
+        sys.stdout.write("".join(lines))
         
         # Get specific information
         default_dist = parser.get_default_distribution()
@@ -47,10 +48,13 @@ def main():
         
         # Get JSON output
         print("\n=== JSON Output ===")
-        print(parser.to_json())
+        parser.to_json_stream(sys.stdout)
+        print()
         
     except Exception as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    # Make the wsl_manager package importable when run from a source checkout
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     main()
@@ -7,12 +7,9 @@ For new installations, use: wsl-manager-gui
 """
 
 import sys
-import os
-from pathlib import Path
 
-# Add the current directory to Python path for backward compatibility
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+# Running this file puts its directory first on sys.path, so the
+# wsl_manager package next to it is importable without any path setup
 
 def main():
     """Launch the GUI application."""
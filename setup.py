@@ -4,23 +4,24 @@ Setup script for WSL Manager
 """
 
 from setuptools import setup, find_packages
-import os
+from pathlib import Path
+
+HERE = Path(__file__).parent
 
 # Read the README file
 def read_readme():
-    readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
-    if os.path.exists(readme_path):
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    return "WSL Manager - A tool for managing WSL distributions"
+    try:
+        return (HERE / 'README.md').read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return "WSL Manager - A tool for managing WSL distributions"
 
 # Read requirements
 def read_requirements():
-    requirements_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
-    if os.path.exists(requirements_path):
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    return []
+    try:
+        lines = (HERE / 'requirements.txt').read_text(encoding='utf-8').splitlines()
+    except FileNotFoundError:
+        return []
+    return [line.strip() for line in lines if line.strip() and not line.startswith('#')]
 
 setup(
     name="wsl-manager",
@@ -51,6 +52,9 @@ setup(
         "build": [
             "pyinstaller>=5.13.0",
         ],
+        "speedups": [
+            "orjson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
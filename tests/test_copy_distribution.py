@@ -0,0 +1,88 @@
+"""
+Tests for copy_distribution's fallback to a temporary tar file.
+
+A fake 'wsl' executable is put first on PATH. Like older wsl.exe versions
+it rejects '-' for --export and --import and prints the error to stdout.
+"""
+
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from wsl_manager.core.parser import copy_distribution
+
+FAKE_WSL = textwrap.dedent('''\
+    #!{python}
+    import os, sys
+    state = os.environ['FAKE_WSL_STATE']
+    registered = os.path.join(state, 'registered')
+    args = sys.argv[1:]
+
+    def fail(message):
+        # wsl.exe writes its errors to stdout, in UTF-16 LE
+        sys.stdout.buffer.write(message.encode('utf-16le'))
+        sys.exit(1)
+
+    if args[:2] == ['--list', '--quiet']:
+        if not os.path.exists(registered):
+            fail('Windows Subsystem for Linux has no installed distributions.')
+        with open(registered) as f:
+            sys.stdout.buffer.write(f.read().encode('utf-16le'))
+    elif args[0] == '--export':
+        if args[2] == '-':
+            fail('Invalid command line argument: -\\r\\nError code: Wsl/E_INVALIDARG')
+        with open(args[2], 'wb') as f:
+            f.write(b'rootfs of ' + args[1].encode())
+    elif args[0] == '--import':
+        if args[3] == '-':
+            sys.stdin.buffer.read()
+            fail('Invalid command line argument: -\\r\\nError code: Wsl/E_INVALIDARG')
+        with open(args[3], 'rb') as f:
+            if f.read() != b'rootfs of Ubuntu':
+                fail('The imported file is not a valid tar file.')
+        with open(registered, 'a') as f:
+            f.write(args[1] + '\\r\\n')
+    else:
+        fail('Unexpected arguments: ' + ' '.join(args))
+''')
+
+
+@unittest.skipIf(sys.platform == 'win32', "the fake wsl needs a shebang")
+class CopyDistributionFallbackTest(unittest.TestCase):
+    
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.state = Path(temp_dir.name)
+        
+        wsl = self.state / 'wsl'
+        wsl.write_text(FAKE_WSL.format(python=sys.executable))
+        wsl.chmod(wsl.stat().st_mode | stat.S_IXUSR)
+        
+        env = {'PATH': f"{self.state}{os.pathsep}{os.environ.get('PATH', '')}",
+               'FAKE_WSL_STATE': str(self.state)}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_falls_back_to_temporary_file_when_streaming_fails(self):
+        copy_distribution('Ubuntu', 'Ubuntu-copy', str(self.state / 'copy'))
+        
+        registered = (self.state / 'registered').read_text().split()
+        self.assertEqual(registered, ['Ubuntu-copy'])
+    
+    def test_does_not_retry_once_the_new_name_is_registered(self):
+        (self.state / 'registered').write_text('Ubuntu-copy\r\n')
+        
+        with self.assertRaises(subprocess.CalledProcessError):
+            copy_distribution('Ubuntu', 'Ubuntu-copy', str(self.state / 'copy'))
+
+
+if __name__ == '__main__':
+    unittest.main()
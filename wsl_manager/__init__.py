@@ -9,8 +9,7 @@ __version__ = "1.0.0"
 __author__ = "Stefan Cula"
 __email__ = "stefanncula@gmail.com"
 
-from .core.parser import WSLParser
-from .core.online_parser import WSLOnlineParser
+import importlib
 
 __all__ = [
     "WSLParser",
@@ -19,3 +18,16 @@ __all__ = [
     "__author__",
     "__email__",
 ]
+
+# The parsers are imported on first access, so entry points only load the
+# modules they actually use
+_LAZY_ATTRS = {
+    "WSLParser": ".core.parser",
+    "WSLOnlineParser": ".core.online_parser",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
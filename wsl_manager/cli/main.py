@@ -9,12 +9,11 @@ import sys
 import os
 from pathlib import Path
 
-from ..core.parser import WSLParser
-from ..core.online_parser import WSLOnlineParser
-
 
 def show_installed_distributions():
     """Show currently installed WSL distributions."""
+    from ..core.parser import WSLParser
+    
     print("=== Installed WSL Distributions ===")
     parser = WSLParser()
     
@@ -24,13 +23,22 @@ def show_installed_distributions():
         
         if distributions:
             print(f"\nTotal: {len(distributions)} distribution(s)")
-            default_dist = parser.get_default_distribution()
+            
+            # wsl.exe ran once above; tally the list in a single pass
+            default_dist = None
+            running = stopped = 0
+            for dist in distributions:
+                state = dist.state.lower()
+                if state == 'running':
+                    running += 1
+                elif state == 'stopped':
+                    stopped += 1
+                if dist.is_default and default_dist is None:
+                    default_dist = dist
+            
             if default_dist:
                 print(f"Default: {default_dist.name}")
-            
-            running = parser.get_running_distributions()
-            stopped = parser.get_stopped_distributions()
-            print(f"Running: {len(running)}, Stopped: {len(stopped)}")
+            print(f"Running: {running}, Stopped: {stopped}")
         
     except Exception as e:
         print(f"Error: {e}")
@@ -38,6 +46,8 @@ def show_installed_distributions():
 
 def show_available_distributions():
     """Show available WSL distributions that can be installed."""
+    from ..core.online_parser import WSLOnlineParser
+    
     print("=== Available WSL Distributions ===")
     parser = WSLOnlineParser()
     
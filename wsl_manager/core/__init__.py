@@ -4,8 +4,7 @@ Core functionality for WSL Manager.
 This module contains the core parsing and management logic for WSL distributions.
 """
 
-from .parser import WSLParser, WSLDistribution
-from .online_parser import WSLOnlineParser, WSLOnlineDistribution
+import importlib
 
 __all__ = [
     "WSLParser",
@@ -13,3 +12,17 @@ __all__ = [
     "WSLOnlineParser",
     "WSLOnlineDistribution",
 ]
+
+# Imported on first access so that importing one parser doesn't load the other
+_LAZY_ATTRS = {
+    "WSLParser": ".parser",
+    "WSLDistribution": ".parser",
+    "WSLOnlineParser": ".online_parser",
+    "WSLOnlineDistribution": ".online_parser",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,134 +7,181 @@ and provides structured data about available WSL distributions that can be insta
 """
 
 import subprocess
-import json
 import os
-from typing import List, Dict, Optional
+import re
+import sys
+import time
+from typing import List, Dict, Optional, TextIO, NamedTuple, Tuple
 from ..utils.subprocess_utils import run_wsl_command
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
 
-@dataclass
+# How long (seconds) the output of 'wsl --list --online' is reused. The list
+# comes from the network and rarely changes, and fetching it takes seconds.
+ONLINE_CACHE_TTL = 600
+
+# How long (seconds) to wait for a distribution installed with --no-launch
+# to be registered, and how often (seconds) to check. Kept short: some
+# distributions (appx-based ones) are only registered on their first launch,
+# and for those no amount of waiting helps.
+REGISTER_TIMEOUT = 5
+REGISTER_POLL_INTERVAL = 0.5
+
+# A distribution row: the name, then the friendly name after the column gap.
+# Matched line by line across the whole output, so it stays within a line
+# (trailing whitespace and the \r of Windows line endings are left out) and
+# skips the introductory lines in case they follow the header.
+_ROW_RE = re.compile(r'^(?!The following|Install using)[ \t]*(\S+)[ \t]+(.*\S)', re.MULTILINE)
+
+
+# Slots where dataclass can add them (3.10+), as for WSLDistribution
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
 class WSLOnlineDistribution:
     """Represents an available WSL distribution that can be installed."""
     name: str
     friendly_name: str
+    
+    def to_dict(self) -> Dict:
+        """Return the fields as a dictionary (a flat copy, unlike asdict())."""
+        return dict(zip(_DISTRIBUTION_FIELDS, _get_distribution_fields(self)))
+
+
+_DISTRIBUTION_FIELDS = tuple(f.name for f in fields(WSLOnlineDistribution))
+_get_distribution_fields = attrgetter(*_DISTRIBUTION_FIELDS)
+
+
+class _DistributionIndex(NamedTuple):
+    """Lookup data derived from one fetched distribution list."""
+    distributions: List[WSLOnlineDistribution]  # The list this was built from
+    lowered: List[Tuple[WSLOnlineDistribution, str, str]]  # With lowercased name and friendly name
+    by_name: Dict[str, WSLOnlineDistribution]  # Keyed by lowercased name
+    ubuntu: List[WSLOnlineDistribution]
+    enterprise: List[WSLOnlineDistribution]
 
 
 class WSLOnlineParser:
     """Parser for WSL online distribution information."""
     
+    ENTERPRISE_KEYWORDS = ("enterprise", "oracle", "suse")
+    
     def __init__(self):
         self.distributions: List[WSLOnlineDistribution] = []
+        self._index: Optional[_DistributionIndex] = None  # See _get_index
+        self._parsed_output: Optional[str] = None  # Output self.distributions came from
+        self._output_cache: Optional[Tuple[float, str]] = None  # (time.monotonic() when fetched, output)
     
-    def get_wsl_online_output(self) -> str:
-        """Execute 'wsl --list --online' command and return the output."""
+    def get_wsl_online_output(self, refresh: bool = False) -> str:
+        """Execute 'wsl --list --online' command and return the output.
+        
+        Output fetched less than ONLINE_CACHE_TTL seconds ago is reused
+        unless refresh is True.
+        """
+        cache = self._output_cache
+        if not refresh and cache is not None and time.monotonic() - cache[0] < ONLINE_CACHE_TTL:
+            return cache[1]
+        
         try:
             result = run_wsl_command(['wsl', '--list', '--online'])
             # WSL output is in UTF-16 LE encoding without BOM
-            return result.stdout.decode('utf-16le')
+            output = result.stdout.decode('utf-16le')
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to execute wsl command: {e}")
         except FileNotFoundError:
             raise RuntimeError("WSL command not found. Make sure WSL is installed.")
+        
+        self._output_cache = (time.monotonic(), output)
+        return output
     
     def parse_wsl_online_output(self, output: str) -> List[WSLOnlineDistribution]:
         """Parse the output from 'wsl --list --online' command."""
-        lines = output.strip().split('\n')
-        
-        if len(lines) < 3:
-            return []
+        # Skip the introductory text up to the header line with "NAME" and
+        # "FRIENDLY NAME"; without a header there is nothing to parse
+        header = output.find("FRIENDLY NAME")
+        body = output.find("\n", header) + 1 if header >= 0 else 0
         
-        distributions = []
-        
-        # Find the header line and start parsing from the next line
-        header_found = False
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            # Look for the header line with "NAME" and "FRIENDLY NAME"
-            if "NAME" in line and "FRIENDLY NAME" in line:
-                header_found = True
-                continue
-            
-            # Skip empty lines and the introductory text
-            if not line or not header_found:
-                continue
-            
-            # Skip lines that don't look like distribution entries
-            if line.startswith("The following") or line.startswith("Install using"):
-                continue
-            
-            # Parse the distribution line
-            # The format is: NAME                            FRIENDLY NAME
-            # We need to split on the boundary between the two columns
-            
-            # Find the position where the friendly name starts
-            # The friendly name typically starts after a long sequence of spaces
-            parts = line.split()
-            
-            if len(parts) >= 2:
-                # The first part is the name, the rest is the friendly name
-                name = parts[0]
-                friendly_name = ' '.join(parts[1:])
-                
-                distribution = WSLOnlineDistribution(
-                    name=name,
-                    friendly_name=friendly_name
-                )
-                distributions.append(distribution)
+        # The format is: NAME                            FRIENDLY NAME
+        # The name has no spaces, so it ends at the first run of spaces and
+        # the rest of the line is the friendly name. All rows are found in
+        # one scan of the output rather than a split and a match per line.
+        # Names are interned, so comparing them with other interned names
+        # is an identity check.
+        distributions = [WSLOnlineDistribution(sys.intern(name), friendly_name)
+                         for name, friendly_name in _ROW_RE.findall(output, body)] if body else []
         
         self.distributions = distributions
+        self._parsed_output = None  # Set by get_online_distributions
         return distributions
     
-    def get_online_distributions(self) -> List[WSLOnlineDistribution]:
-        """Get available WSL distributions by running the command and parsing output."""
-        output = self.get_wsl_online_output()
-        return self.parse_wsl_online_output(output)
+    def get_online_distributions(self, refresh: bool = False) -> List[WSLOnlineDistribution]:
+        """Get available WSL distributions by running the command and parsing output.
+        
+        A recently fetched list is reused unless refresh is True (see
+        get_wsl_online_output). Output identical to the last parsed one is
+        not parsed again, which also keeps the lookup index valid.
+        """
+        output = self.get_wsl_online_output(refresh)
+        if output == self._parsed_output:
+            return self.distributions
+        distributions = self.parse_wsl_online_output(output)
+        self._parsed_output = output
+        return distributions
+    
+    def _get_index(self) -> _DistributionIndex:
+        """Return the lookup index for the current list, building it if needed.
+        
+        Every name is lowercased and categorized once per fetch; the index is
+        rebuilt when the distribution list is replaced.
+        """
+        if self._index is None or self._index.distributions is not self.distributions:
+            lowered, by_name, ubuntu, enterprise = [], {}, [], []
+            for dist in self.distributions:
+                name, friendly_name = dist.name.lower(), dist.friendly_name.lower()
+                lowered.append((dist, name, friendly_name))
+                by_name.setdefault(name, dist)
+                if "ubuntu" in name or "ubuntu" in friendly_name:
+                    ubuntu.append(dist)
+                for keyword in self.ENTERPRISE_KEYWORDS:
+                    if keyword in name or keyword in friendly_name:
+                        enterprise.append(dist)
+                        break
+            self._index = _DistributionIndex(self.distributions, lowered, by_name, ubuntu, enterprise)
+        return self._index
     
     def get_distribution_by_name(self, name: str) -> Optional[WSLOnlineDistribution]:
         """Get a specific distribution by name."""
-        for dist in self.distributions:
-            if dist.name.lower() == name.lower():
-                return dist
-        return None
+        return self._get_index().by_name.get(name.lower())
     
     def search_distributions(self, search_term: str) -> List[WSLOnlineDistribution]:
         """Search distributions by name or friendly name."""
         search_term = search_term.lower()
-        results = []
-        
-        for dist in self.distributions:
-            if (search_term in dist.name.lower() or 
-                search_term in dist.friendly_name.lower()):
-                results.append(dist)
-        
-        return results
+        return [dist for dist, name, friendly_name in self._get_index().lowered
+                if search_term in name or search_term in friendly_name]
     
     def get_ubuntu_distributions(self) -> List[WSLOnlineDistribution]:
         """Get all Ubuntu distributions."""
-        return self.search_distributions("ubuntu")
+        return list(self._get_index().ubuntu)
     
     def get_enterprise_distributions(self) -> List[WSLOnlineDistribution]:
         """Get enterprise distributions (SUSE, Oracle, etc.)."""
-        enterprise_keywords = ["enterprise", "oracle", "suse"]
-        results = []
-        
-        for dist in self.distributions:
-            for keyword in enterprise_keywords:
-                if keyword in dist.name.lower() or keyword in dist.friendly_name.lower():
-                    results.append(dist)
-                    break
-        
-        return results
+        return list(self._get_index().enterprise)
     
     def to_dict(self) -> List[Dict]:
         """Convert distributions to list of dictionaries."""
-        return [asdict(dist) for dist in self.distributions]
+        return [dist.to_dict() for dist in self.distributions]
     
-    def to_json(self, indent: int = 2) -> str:
-        """Convert distributions to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Convert distributions to JSON string (compact if indent is None)."""
+        import json  # Only needed for export, so kept off the startup path
+        
+        return json.dumps(self.to_dict(), indent=indent,
+                          separators=(',', ':') if indent is None else None)
+    
+    def to_json_stream(self, fp: TextIO, indent: int = 2):
+        """Write distributions as JSON to a file-like object."""
+        import json
+        
+        json.dump(self.to_dict(), fp, indent=indent)
     
     def print_summary(self):
         """Print a formatted summary of available WSL distributions."""
@@ -142,15 +189,14 @@ class WSLOnlineParser:
             print("No available WSL distributions found.")
             return
         
-        print(f"Found {len(self.distributions)} available WSL distribution(s):")
-        print("-" * 80)
-        print(f"{'Name':<30} {'Friendly Name':<45}")
-        print("-" * 80)
-        
-        for dist in self.distributions:
-            print(f"{dist.name:<30} {dist.friendly_name:<45}")
-        
-        print("-" * 80)
+        # Built up front and printed in one write, which is much faster than
+        # a write per line on the Windows console
+        rule = "-" * 80
+        lines = [f"Found {len(self.distributions)} available WSL distribution(s):",
+                 rule, f"{'Name':<30} {'Friendly Name':<45}", rule]
+        lines.extend(f"{dist.name:<30} {dist.friendly_name:<45}" for dist in self.distributions)
+        lines.append(rule)
+        print("\n".join(lines))
     
     def print_install_commands(self):
         """Print the install commands for all distributions."""
@@ -158,13 +204,11 @@ class WSLOnlineParser:
             print("No available WSL distributions found.")
             return
         
-        print("Install commands for available distributions:")
-        print("-" * 50)
-        
-        for dist in self.distributions:
-            print(f"wsl --install {dist.name}")
-        
-        print("-" * 50)
+        rule = "-" * 50
+        lines = ["Install commands for available distributions:", rule]
+        lines.extend(f"wsl --install {dist.name}" for dist in self.distributions)
+        lines.append(rule)
+        print("\n".join(lines))
     
     def install_distribution(self, distribution_name: str, custom_name: str = None) -> bool:
         """Install a WSL distribution with an optional custom name."""
@@ -187,7 +231,7 @@ class WSLOnlineParser:
                 install_cmd = ['wsl', '--install', distribution_name]
                 
                 # Execute the install command
-                result = run_wsl_command(install_cmd, text=True)
+                run_wsl_command(install_cmd, text=True, discard_stdout=True)
                 
                 return True
             
@@ -197,46 +241,52 @@ class WSLOnlineParser:
         except Exception as e:
             raise RuntimeError(f"Error installing distribution '{distribution_name}': {e}")
     
+    def _wait_until_registered(self, distribution_name: str) -> bool:
+        """Wait up to REGISTER_TIMEOUT seconds for a distribution to be registered.
+        
+        Returns False if it still isn't registered by then.
+        """
+        from .parser import is_registered
+        
+        deadline = time.monotonic() + REGISTER_TIMEOUT
+        while not is_registered(distribution_name):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(REGISTER_POLL_INTERVAL)
+        return True
+    
     def _install_with_custom_name(self, distribution_name: str, custom_name: str) -> bool:
         """Install a distribution with a custom name using export/import method."""
-        import tempfile
-        import time
+        from .parser import copy_distribution
         
         try:
             # Step 1: Install with default name (no-launch to avoid opening terminal)
             print(f"Installing {distribution_name} with default name...")
             install_cmd = ['wsl', '--install', distribution_name, '--no-launch']
-            run_wsl_command(install_cmd, text=True)
+            run_wsl_command(install_cmd, text=True, discard_stdout=True)
             
-            # Step 2: Wait for installation to complete
+            # Step 2: Wait for the installation to complete (polling instead
+            # of a fixed delay)
             print("Waiting for installation to complete...")
-            time.sleep(5)
-            
-            # Step 3: Export the distribution to a temporary file
-            with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as temp_file:
-                temp_path = temp_file.name
+            if not self._wait_until_registered(distribution_name):
+                raise RuntimeError(
+                    f"'{distribution_name}' was installed but not registered, which happens for "
+                    f"distributions that only register on their first launch. Launch it once, "
+                    f"then rename it to '{custom_name}'.")
             
-            print(f"Exporting {distribution_name} to temporary file...")
-            export_cmd = ['wsl', '--export', distribution_name, temp_path]
-            run_wsl_command(export_cmd, text=True)
-            
-            # Step 4: Import with custom name
-            print(f"Importing as {custom_name}...")
+            # Step 3: Copy the distribution under the custom name
+            print(f"Copying {distribution_name} as {custom_name}...")
             import_location = f"C:\\Users\\{os.getenv('USERNAME')}\\AppData\\Local\\Packages\\CanonicalGroupLimited.{custom_name}_79rhkp1fndgsc\\LocalState"
             
             # Create the directory if it doesn't exist
             os.makedirs(import_location, exist_ok=True)
             
-            import_cmd = ['wsl', '--import', custom_name, import_location, temp_path]
-            run_wsl_command(import_cmd, text=True)
+            copy_distribution(distribution_name, custom_name, import_location)
             
-            # Step 5: Unregister the original distribution
+            # Step 4: Unregister the original distribution
             print(f"Removing original {distribution_name}...")
             unregister_cmd = ['wsl', '--unregister', distribution_name]
-            run_wsl_command(unregister_cmd, text=True)
-            
-            # Step 6: Clean up temporary file
-            os.unlink(temp_path)
+            run_wsl_command(unregister_cmd, text=True, discard_stdout=True)
             
             print(f"Successfully installed {distribution_name} as {custom_name}")
             return True
@@ -246,13 +296,6 @@ class WSLOnlineParser:
             raise RuntimeError(f"Failed to install with custom name: {error_msg}")
         except Exception as e:
             raise RuntimeError(f"Error installing with custom name: {e}")
-        finally:
-            # Clean up temporary file if it exists
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except:
-                pass
 
 
 def main():
@@ -6,21 +6,97 @@ A Python application that parses the output from 'wsl -l -v' command
 and provides structured data about WSL distributions.
 """
 
+import os
 import subprocess
-import re
-import json
-from typing import List, Dict, Optional
-from ..utils.subprocess_utils import run_wsl_command
-from dataclasses import dataclass, asdict
+import string
+import sys
+import time
+from typing import List, Dict, Optional, TextIO, Tuple
+from ..utils.subprocess_utils import run_wsl_command, pipe_wsl_commands
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
+# How long (seconds) the output of 'wsl -l -v' is reused. Each run can have
+# to wake the WSL VM, and changes made through WSLParser drop it right away.
+INSTALLED_CACHE_TTL = 30
 
-@dataclass
+# Valid distribution names: letters, numbers, hyphens and underscores
+VALID_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+
+
+def is_valid_name(name: str) -> bool:
+    """Return True if name is a non-empty string of valid name characters."""
+    return bool(name) and VALID_NAME_CHARS.issuperset(name)
+
+
+def is_registered(distribution_name: str) -> bool:
+    """Return True if WSL lists a distribution with the given name."""
+    result = run_wsl_command(['wsl', '--list', '--quiet'], check=False)
+    # With no distributions WSL prints a message instead and exits non-zero
+    if result.returncode != 0:
+        return False
+    names = result.stdout.decode('utf-16le').replace('\0', '').split()
+    return distribution_name.lower() in (name.lower() for name in names)
+
+
+def copy_distribution(distribution_name: str, new_name: str, location: str):
+    """Import a copy of a distribution as new_name, stored at location.
+    
+    The export is streamed straight into the import, so the distribution
+    (often gigabytes) is never written out as a tar file. If streaming
+    fails and nothing was registered, the copy is retried through a
+    temporary tar file, which older WSL versions need.
+    """
+    import tempfile  # Only needed when streaming isn't supported
+    
+    try:
+        pipe_wsl_commands(['wsl', '--export', distribution_name, '-'],
+                          ['wsl', '--import', new_name, location, '-'])
+        return
+    except subprocess.CalledProcessError:
+        # wsl.exe prints its errors to stdout, which for the export is the
+        # pipe, so the error can't tell an unsupported '-' from any other
+        # failure. Retry unless the failed import left something behind.
+        if is_registered(new_name):
+            raise
+    
+    print("Streaming failed, retrying with a temporary file...")
+    with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as temp_file:
+        temp_path = temp_file.name
+    try:
+        export_cmd = ['wsl', '--export', distribution_name, temp_path]
+        run_wsl_command(export_cmd, text=True, discard_stdout=True)
+        
+        import_cmd = ['wsl', '--import', new_name, location, temp_path]
+        run_wsl_command(import_cmd, text=True, discard_stdout=True)
+    finally:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+# is_default has a default value, which hand-written __slots__ can't hold,
+# so the instances only get slots where dataclass can add them (3.10+)
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
 class WSLDistribution:
     """Represents a WSL distribution with its properties."""
     name: str
     state: str
     version: str
     is_default: bool = False
+    
+    def to_dict(self) -> Dict:
+        """Return the fields as a dictionary.
+        
+        The fields are flat, so this is a plain copy rather than the
+        recursive walk dataclasses.asdict() does.
+        """
+        return dict(zip(_DISTRIBUTION_FIELDS, _get_distribution_fields(self)))
+
+
+_DISTRIBUTION_FIELDS = tuple(f.name for f in fields(WSLDistribution))
+_get_distribution_fields = attrgetter(*_DISTRIBUTION_FIELDS)
 
 
 class WSLParser:
@@ -28,26 +104,51 @@ class WSLParser:
     
     def __init__(self):
         self.distributions: List[WSLDistribution] = []
+        self._output_cache: Optional[Tuple[float, str]] = None  # (time.monotonic() when fetched, output)
+        # Lookups into self.distributions, rebuilt whenever it is parsed
+        self._by_name: Dict[str, WSLDistribution] = {}
+        self._default: Optional[WSLDistribution] = None
     
-    def get_wsl_output(self) -> str:
-        """Execute 'wsl -l -v' command and return the output."""
+    def get_wsl_output(self, refresh: bool = False) -> str:
+        """Execute 'wsl -l -v' command and return the output.
+        
+        Output fetched less than INSTALLED_CACHE_TTL seconds ago is reused
+        unless refresh is True.
+        """
+        cache = self._output_cache
+        if not refresh and cache is not None and time.monotonic() - cache[0] < INSTALLED_CACHE_TTL:
+            return cache[1]
+        
         try:
             result = run_wsl_command(['wsl', '-l', '-v'])
             # WSL output is in UTF-16 LE encoding without BOM
-            return result.stdout.decode('utf-16le')
+            output = result.stdout.decode('utf-16le')
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to execute wsl command: {e}")
         except FileNotFoundError:
             raise RuntimeError("WSL command not found. Make sure WSL is installed.")
+        
+        self._output_cache = (time.monotonic(), output)
+        return output
+    
+    def invalidate(self):
+        """Drop the cached 'wsl -l -v' output, e.g. after distributions changed."""
+        self._output_cache = None
     
     def parse_wsl_output(self, output: str) -> List[WSLDistribution]:
         """Parse the output from 'wsl -l -v' command."""
-        # Handle Windows line endings properly
-        lines = output.strip().replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        # splitlines() handles Windows line endings in the same pass. Only
+        # line breaks are stripped in front, since the header's indentation
+        # lines it up with the data lines.
+        lines = output.lstrip('\r\n').rstrip().splitlines()
         
         if len(lines) < 2:
             return []
         
+        # The output uses fixed-width columns lined up under the header:
+        # "  NAME             STATE           VERSION"
+        columns = self._column_bounds(lines[0])
+        
         # Skip the header line
         data_lines = lines[1:]
         
@@ -60,15 +161,19 @@ class WSLParser:
             
             # Check if this is the default distribution (marked with *)
             is_default = line.startswith('*')
+            
+            # Slice the columns at the header's offsets (the asterisk sits
+            # before the name column) if the row lines up with the header
+            if columns and all(line[start - 1:start].isspace() for start, _ in columns[1:]):
+                name, state, version = [line[start:end].strip() for start, end in columns]
+                if name and state and version:
+                    distributions.append(WSLDistribution(name, state, version, is_default))
+                continue
+            
             if is_default:
                 line = line[1:]  # Remove the asterisk but keep the space
             
-            # The output uses fixed-width columns
-            # Based on the header: "  NAME             STATE           VERSION"
-            # Let's use a more flexible approach to find column boundaries
-            
-            # Find the start of each column by looking for the header pattern
-            # NAME starts after the initial spaces, STATE and VERSION follow
+            # Without a usable header, split on whitespace
             parts = line.split()
             
             if len(parts) >= 3:
@@ -95,26 +200,38 @@ class WSLParser:
                 distributions.append(distribution)
         
         self.distributions = distributions
+        # Built from the end so the first distribution with a name wins
+        self._by_name = {dist.name: dist for dist in reversed(distributions)}
+        self._default = next((dist for dist in distributions if dist.is_default), None)
         return distributions
     
-    def get_distributions(self) -> List[WSLDistribution]:
-        """Get WSL distributions by running the command and parsing output."""
-        output = self.get_wsl_output()
+    @staticmethod
+    def _column_bounds(header: str) -> Optional[List[Tuple[int, Optional[int]]]]:
+        """Return the (start, end) offsets of the name, state and version
+        columns from the header line, or None if it doesn't have three words.
+        """
+        starts = [i for i, (prev, char) in enumerate(zip(' ' + header, header))
+                  if prev.isspace() and not char.isspace()]
+        if len(starts) != 3:
+            return None
+        return list(zip(starts, starts[1:] + [None]))
+    
+    def get_distributions(self, refresh: bool = False) -> List[WSLDistribution]:
+        """Get WSL distributions by running the command and parsing output.
+        
+        Recently fetched output is reused unless refresh is True (see
+        get_wsl_output).
+        """
+        output = self.get_wsl_output(refresh)
         return self.parse_wsl_output(output)
     
     def get_distribution_by_name(self, name: str) -> Optional[WSLDistribution]:
         """Get a specific distribution by name."""
-        for dist in self.distributions:
-            if dist.name == name:
-                return dist
-        return None
+        return self._by_name.get(name)
     
     def get_default_distribution(self) -> Optional[WSLDistribution]:
         """Get the default WSL distribution."""
-        for dist in self.distributions:
-            if dist.is_default:
-                return dist
-        return None
+        return self._default
     
     def get_running_distributions(self) -> List[WSLDistribution]:
         """Get all running WSL distributions."""
@@ -126,23 +243,35 @@ class WSLParser:
     
     def to_dict(self) -> List[Dict]:
         """Convert distributions to list of dictionaries."""
-        return [asdict(dist) for dist in self.distributions]
+        return [dist.to_dict() for dist in self.distributions]
     
-    def to_json(self, indent: int = 2) -> str:
-        """Convert distributions to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Convert distributions to JSON string (compact if indent is None)."""
+        import json  # Only needed for export, so kept off the startup path
+        
+        return json.dumps(self.to_dict(), indent=indent,
+                          separators=(',', ':') if indent is None else None)
+    
+    def to_json_stream(self, fp: TextIO, indent: int = 2):
+        """Write distributions as JSON to a file-like object."""
+        import json
+        
+        json.dump(self.to_dict(), fp, indent=indent)
     
     def delete_distribution(self, name: str) -> bool:
         """Delete a WSL distribution by name."""
         try:
-            # First, ensure distributions are loaded and check if the distribution exists
-            self.get_distributions()  # This populates self.distributions
+            # Check against a fresh list, not the cached one, before changing anything
+            self.get_distributions(refresh=True)  # This populates self.distributions
             dist = self.get_distribution_by_name(name)
             if not dist:
                 raise ValueError(f"Distribution '{name}' not found")
             
             # Execute the unregister command
-            result = run_wsl_command(['wsl', '--unregister', name])
+            try:
+                run_wsl_command(['wsl', '--unregister', name], discard_stdout=True)
+            finally:
+                self.invalidate()
             
             # Refresh the distributions list after deletion
             self.get_distributions()
@@ -156,13 +285,9 @@ class WSLParser:
     
     def rename_distribution(self, old_name: str, new_name: str) -> bool:
         """Rename a WSL distribution using export/import method."""
-        import tempfile
-        import time
-        import os
-        
         try:
-            # First, ensure distributions are loaded and check if the distribution exists
-            self.get_distributions()  # This populates self.distributions
+            # Check against a fresh list, not the cached one, before changing anything
+            self.get_distributions(refresh=True)  # This populates self.distributions
             dist = self.get_distribution_by_name(old_name)
             if not dist:
                 raise ValueError(f"Distribution '{old_name}' not found")
@@ -173,53 +298,38 @@ class WSLParser:
                 raise ValueError(f"Distribution '{new_name}' already exists")
             
             # Validate new name (basic validation)
-            if not new_name.replace('-', '').replace('_', '').isalnum():
+            if not is_valid_name(new_name):
                 raise ValueError("New name can only contain letters, numbers, hyphens, and underscores")
             
-            # Step 1: Export the distribution to a temporary file
-            with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            print(f"Exporting {old_name} to temporary file...")
-            export_cmd = ['wsl', '--export', old_name, temp_path]
-            run_wsl_command(export_cmd, text=True)
-            
-            # Step 2: Import with new name
-            print(f"Importing as {new_name}...")
+            # Step 1: Copy the distribution under the new name
+            print(f"Copying {old_name} as {new_name}...")
             import_location = f"C:\\Users\\{os.getenv('USERNAME')}\\AppData\\Local\\Packages\\CanonicalGroupLimited.{new_name}_79rhkp1fndgsc\\LocalState"
             
             # Create the directory if it doesn't exist
             os.makedirs(import_location, exist_ok=True)
             
-            import_cmd = ['wsl', '--import', new_name, import_location, temp_path]
-            run_wsl_command(import_cmd, text=True)
+            copy_distribution(old_name, new_name, import_location)
             
-            # Step 3: Unregister the original distribution
+            # Step 2: Unregister the original distribution
             print(f"Removing original {old_name}...")
             unregister_cmd = ['wsl', '--unregister', old_name]
-            run_wsl_command(unregister_cmd, text=True)
-            
-            # Step 4: Clean up temporary file
-            os.unlink(temp_path)
+            run_wsl_command(unregister_cmd, text=True, discard_stdout=True)
             
-            # Step 5: Refresh the distributions list
+            # Step 3: Refresh the distributions list
+            self.invalidate()
             self.get_distributions()
             
             print(f"Successfully renamed {old_name} to {new_name}")
             return True
             
         except subprocess.CalledProcessError as e:
+            # A failed rename may still have imported the copy
+            self.invalidate()
             error_msg = e.stderr if isinstance(e.stderr, str) else e.stderr.decode('utf-8', errors='ignore')
             raise RuntimeError(f"Failed to rename distribution: {error_msg}")
         except Exception as e:
+            self.invalidate()
             raise RuntimeError(f"Error renaming distribution: {e}")
-        finally:
-            # Clean up temporary file if it exists
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except:
-                pass
     
     def print_summary(self):
         """Print a formatted summary of WSL distributions."""
@@ -227,15 +337,15 @@ class WSLParser:
             print("No WSL distributions found.")
             return
         
-        print(f"Found {len(self.distributions)} WSL distribution(s):")
-        print("-" * 60)
-        
+        # Built up front and printed in one write, which is much faster than
+        # a write per line on the Windows console
+        rule = "-" * 60
+        lines = [f"Found {len(self.distributions)} WSL distribution(s):", rule]
         for dist in self.distributions:
             default_marker = " (DEFAULT)" if dist.is_default else ""
-            print(f"Name: {dist.name}{default_marker}")
-            print(f"State: {dist.state}")
-            print(f"Version: {dist.version}")
-            print("-" * 60)
+            lines += (f"Name: {dist.name}{default_marker}", f"State: {dist.state}",
+                      f"Version: {dist.version}", rule)
+        print("\n".join(lines))
 
 
 def main():
@@ -13,14 +13,18 @@ def main():
     """Main function to run the GUI application."""
     import tkinter as tk
     from .main_window import WSLManagerGUI
+    from .config import WINDOW_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
     
+    # Build the window hidden so it is only laid out and drawn once, in place
     root = tk.Tk()
+    root.withdraw()
     app = WSLManagerGUI(root)
     
-    # Center the window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f"+{x}+{y}")
+    # Center the window using its configured size instead of measuring it
+    screen_width, screen_height = app.get_screen_size()
+    x = (screen_width - WINDOW_WIDTH) // 2
+    y = (screen_height - WINDOW_HEIGHT) // 2
+    root.geometry(f"{WINDOW_SIZE}+{x}+{y}")
+    root.deiconify()
     
     root.mainloop()
\ No newline at end of file
@@ -3,186 +3,319 @@ Action handlers and business logic for the WSL Manager GUI.
 """
 
 import threading
-import json
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 from typing import Callable, Optional
 
+try:
+    import orjson  # Optional, faster JSON encoder
+except ImportError:
+    orjson = None
+
 from ..core.parser import WSLParser, WSLDistribution
 from ..core.online_parser import WSLOnlineParser, WSLOnlineDistribution
-from .dialogs import RenameDialog, InstallDialog, HelpDialog
-from .models import DistributionSummary, AvailableDistributionSummary
+from .dialogs import NameDialog, HelpDialog
+from .models import DistributionSummary, AvailableDistributionSummary, installed_rows, available_rows
 
 
 class WSLManagerActions:
     """Handles all business logic and actions for the WSL Manager GUI."""
     
-    def __init__(self, status_callback: Callable[[str], None]):
+    def __init__(self, status_callback: Callable[[str], None],
+                 ui_callback: Optional[Callable[..., None]] = None):
         self.status_callback = status_callback
+        # ui_callback(func, *args) runs func on the Tk main thread; worker
+        # threads must route every status, dialog and widget update through it
+        self.ui_callback = ui_callback or (lambda func, *args: func(*args))
         self.help_dialog = HelpDialog(None)
+        self._name_dialog = None
+        
+        # Parsers are kept between actions so their parsed lists can be reused
+        # instead of running wsl.exe again; the locks serialize access from
+        # worker threads. The installed list is marked dirty after changes and
+        # then reloaded through the parser's output cache, which the parser
+        # drops itself after a delete or rename (and installs drop below).
+        self._installed_parser = WSLParser()
+        self._installed_lock = threading.Lock()
+        self._installed_dirty = True
+        self._online_parser = WSLOnlineParser()
+        self._online_lock = threading.Lock()
+        self._online_loaded = False
+        
+        # Background work runs on a small pool of reused threads. Its threads
+        # are joined at exit, so closing the window doesn't abandon a rename
+        # or install halfway through.
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='wsl-gui')
+        
+        # Refreshes in flight, by kind, mapped to a follow-up requested meanwhile
+        self._refreshing = {}
+    
+    def shutdown(self):
+        """Stop accepting background work.
+        
+        Work already submitted still runs to completion before the
+        interpreter exits, but this doesn't wait for it.
+        """
+        self._executor.shutdown(wait=False)
     
-    def refresh_installed_distributions(self, callback: Callable[[list, str], None]):
-        """Refresh installed distributions data in a separate thread."""
+    def _set_status(self, message: str):
+        """Update the status from a worker thread."""
+        self.ui_callback(self.status_callback, message)
+    
+    def _start_refresh(self, kind: str, refresh: Callable[[], None]):
+        """Run refresh in the background, coalescing overlapping requests.
+        
+        Requests made while a refresh of the same kind is running don't start
+        another run; the latest one runs once the current refresh is done.
+        """
+        if kind in self._refreshing:
+            self._refreshing[kind] = refresh
+            return
+        self._refreshing[kind] = None
+        
+        def worker():
+            try:
+                refresh()
+            finally:
+                self.ui_callback(self._refresh_done, kind)
+        
+        self._executor.submit(worker)
+    
+    def _refresh_done(self, kind: str):
+        """Finish a refresh and start the follow-up requested meanwhile, if any."""
+        follow_up = self._refreshing.pop(kind, None)
+        if follow_up is not None:
+            self._start_refresh(kind, follow_up)
+    
+    def _get_installed(self, force: bool = False) -> WSLParser:
+        """Return the installed distributions parser, reloading it if needed."""
+        with self._installed_lock:
+            if force or self._installed_dirty:
+                self._installed_parser.get_distributions(refresh=force)
+                self._installed_dirty = False
+            return self._installed_parser
+    
+    def _get_online(self, force: bool = False) -> WSLOnlineParser:
+        """Return the online distributions parser, reloading it if needed."""
+        with self._online_lock:
+            if force or not self._online_loaded:
+                self._online_parser.get_online_distributions(refresh=force)
+                self._online_loaded = True
+            return self._online_parser
+    
+    def prefetch(self):
+        """Start loading the installed distributions in the background.
+        
+        A refresh with force=False then picks up the loaded list. The online
+        list isn't prefetched: 'wsl --list --online' goes over the network,
+        so it waits until the Available tab is first opened. A failed load
+        is shown in the status bar and, since it isn't cached, tried again
+        by the next refresh.
+        """
+        future = self._executor.submit(self._get_installed)
+        future.add_done_callback(self._prefetch_done)
+    
+    def _prefetch_done(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            self._set_status(f"Error loading installed distributions: {future.exception()}")
+    
+    def refresh_installed_distributions(self, callback: Callable[[list, list, str], None], force: bool = True):
+        """Refresh installed distributions data in the background.
+        
+        callback receives the distributions, their treeview rows and the
+        summary text. With force=False the last loaded list is reused unless
+        it is stale.
+        """
         def refresh_thread():
             try:
-                self.status_callback("Loading installed distributions...")
-                parser = WSLParser()
-                distributions = parser.get_distributions()
-                
-                # Calculate summary using model
-                summary_obj = DistributionSummary(
-                    total=len(distributions),
-                    running=len(parser.get_running_distributions()),
-                    stopped=len(parser.get_stopped_distributions()),
-                    default_name=parser.get_default_distribution().name if parser.get_default_distribution() else "None"
-                )
+                self._set_status("Loading installed distributions...")
+                parser = self._get_installed(force)
+                distributions = parser.distributions
                 
-                summary = f"Total: {summary_obj.total} | Running: {summary_obj.running} | Stopped: {summary_obj.stopped} | Default: {summary_obj.default_name}"
+                # Build the rows and summary here so the UI thread only displays them
+                rows = installed_rows(distributions)
+                summary = str(DistributionSummary.from_distributions(distributions))
                 
-                self.status_callback("Installed distributions loaded successfully")
-                callback(distributions, summary)
+                self._set_status("Installed distributions loaded successfully")
+                self.ui_callback(callback, distributions, rows, summary)
                 
             except Exception as e:
-                self.status_callback(f"Error loading installed distributions: {e}")
-                messagebox.showerror("Error", f"Failed to load installed distributions:\n{e}")
+                self._set_status(f"Error loading installed distributions: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to load installed distributions:\n{e}")
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._start_refresh('installed', refresh_thread)
     
-    def refresh_available_distributions(self, callback: Callable[[list, str], None]):
-        """Refresh available distributions data in a separate thread."""
+    def refresh_available_distributions(self, callback: Callable[[list, list, str], None], force: bool = True):
+        """Refresh available distributions data in the background.
+        
+        callback receives the distributions, their treeview rows and the
+        summary text. With force=False the last loaded list is reused if
+        there is one.
+        """
         def refresh_thread():
             try:
-                self.status_callback("Loading available distributions...")
-                parser = WSLOnlineParser()
-                distributions = parser.get_online_distributions()
-                
-                # Calculate summary using model
-                summary_obj = AvailableDistributionSummary(
-                    total=len(distributions),
-                    ubuntu_count=len(parser.get_ubuntu_distributions()),
-                    enterprise_count=len(parser.get_enterprise_distributions())
-                )
+                self._set_status("Loading available distributions...")
+                parser = self._get_online(force)
+                distributions = parser.distributions
                 
-                summary = f"Total: {summary_obj.total} | Ubuntu variants: {summary_obj.ubuntu_count} | Enterprise: {summary_obj.enterprise_count}"
+                # Build the rows and summary here so the UI thread only displays them
+                rows = available_rows(distributions)
+                summary = str(AvailableDistributionSummary.from_distributions(distributions))
                 
-                self.status_callback("Available distributions loaded successfully")
-                callback(distributions, summary)
+                self._set_status("Available distributions loaded successfully")
+                self.ui_callback(callback, distributions, rows, summary)
                 
             except Exception as e:
-                self.status_callback(f"Error loading available distributions: {e}")
-                messagebox.showerror("Error", f"Failed to load available distributions:\n{e}")
+                self._set_status(f"Error loading available distributions: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to load available distributions:\n{e}")
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._start_refresh('available', refresh_thread)
     
     def delete_distribution(self, name: str, callback: Callable[[], None]):
-        """Delete a WSL distribution in a separate thread."""
+        """Delete a WSL distribution in the background."""
         def delete_thread():
             try:
-                self.status_callback(f"Deleting distribution '{name}'...")
+                self._set_status(f"Deleting distribution '{name}'...")
                 
-                # Create parser and delete the distribution
-                parser = WSLParser()
-                parser.delete_distribution(name)
+                try:
+                    with self._installed_lock:
+                        self._installed_parser.delete_distribution(name)
+                finally:
+                    self._installed_dirty = True
                 
-                self.status_callback(f"Distribution '{name}' deleted successfully")
-                messagebox.showinfo("Success", f"Distribution '{name}' has been deleted successfully.")
-                callback()
+                self._set_status(f"Distribution '{name}' deleted successfully")
+                self.ui_callback(messagebox.showinfo, "Success", f"Distribution '{name}' has been deleted successfully.")
+                self.ui_callback(callback)
                 
             except Exception as e:
-                self.status_callback(f"Error deleting distribution: {e}")
-                messagebox.showerror("Error", f"Failed to delete distribution '{name}':\n{e}")
+                self._set_status(f"Error deleting distribution: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to delete distribution '{name}':\n{e}")
         
-        threading.Thread(target=delete_thread, daemon=True).start()
+        self._executor.submit(delete_thread)
     
     def rename_distribution(self, old_name: str, new_name: str, callback: Callable[[], None]):
-        """Rename a WSL distribution in a separate thread."""
+        """Rename a WSL distribution in the background."""
         def rename_thread():
             try:
-                self.status_callback(f"Renaming distribution '{old_name}' to '{new_name}'...")
+                self._set_status(f"Renaming distribution '{old_name}' to '{new_name}'...")
                 
-                # Create parser and rename the distribution
-                parser = WSLParser()
-                parser.rename_distribution(old_name, new_name)
+                try:
+                    with self._installed_lock:
+                        self._installed_parser.rename_distribution(old_name, new_name)
+                finally:
+                    self._installed_dirty = True
                 
-                self.status_callback(f"Distribution '{old_name}' renamed to '{new_name}' successfully")
-                messagebox.showinfo("Success", f"Distribution '{old_name}' has been renamed to '{new_name}' successfully.")
-                callback()
+                self._set_status(f"Distribution '{old_name}' renamed to '{new_name}' successfully")
+                self.ui_callback(messagebox.showinfo, "Success", f"Distribution '{old_name}' has been renamed to '{new_name}' successfully.")
+                self.ui_callback(callback)
                 
             except Exception as e:
-                self.status_callback(f"Error renaming distribution: {e}")
-                messagebox.showerror("Error", f"Failed to rename distribution '{old_name}':\n{e}")
+                self._set_status(f"Error renaming distribution: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to rename distribution '{old_name}':\n{e}")
         
-        threading.Thread(target=rename_thread, daemon=True).start()
+        self._executor.submit(rename_thread)
     
     def install_distribution(self, dist_name: str, friendly_name: str, custom_name: Optional[str], callback: Callable[[], None]):
-        """Install a WSL distribution in a separate thread."""
+        """Install a WSL distribution in the background."""
         def install_thread():
             try:
                 if custom_name:
-                    self.status_callback(f"Installing '{friendly_name}' as '{custom_name}'...")
+                    self._set_status(f"Installing '{friendly_name}' as '{custom_name}'...")
                 else:
-                    self.status_callback(f"Installing '{friendly_name}'...")
+                    self._set_status(f"Installing '{friendly_name}'...")
                 
-                # Create parser and install the distribution
-                parser = WSLOnlineParser()
-                parser.install_distribution(dist_name, custom_name)
+                try:
+                    self._get_online().install_distribution(dist_name, custom_name)
+                finally:
+                    # Under the lock, so a load already running can't cache
+                    # the list from before the install afterwards
+                    with self._installed_lock:
+                        self._installed_parser.invalidate()
+                        self._installed_dirty = True
                 
                 if custom_name:
-                    self.status_callback(f"Distribution '{friendly_name}' installed as '{custom_name}' successfully")
-                    messagebox.showinfo("Success", f"Distribution '{friendly_name}' has been installed as '{custom_name}' successfully.")
+                    self._set_status(f"Distribution '{friendly_name}' installed as '{custom_name}' successfully")
+                    self.ui_callback(messagebox.showinfo, "Success", f"Distribution '{friendly_name}' has been installed as '{custom_name}' successfully.")
                 else:
-                    self.status_callback(f"Distribution '{friendly_name}' installed successfully")
-                    messagebox.showinfo("Success", f"Distribution '{friendly_name}' has been installed successfully.")
+                    self._set_status(f"Distribution '{friendly_name}' installed successfully")
+                    self.ui_callback(messagebox.showinfo, "Success", f"Distribution '{friendly_name}' has been installed successfully.")
                 
-                callback()
+                self.ui_callback(callback)
                 
             except Exception as e:
-                self.status_callback(f"Error installing distribution: {e}")
-                messagebox.showerror("Error", f"Failed to install distribution '{friendly_name}':\n{e}")
+                self._set_status(f"Error installing distribution: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to install distribution '{friendly_name}':\n{e}")
         
-        threading.Thread(target=install_thread, daemon=True).start()
+        self._executor.submit(install_thread)
     
     def export_to_json(self, callback: Callable[[str], None]):
-        """Export data to JSON format."""
-        try:
-            # Get data from both parsers
-            installed_parser = WSLParser()
-            available_parser = WSLOnlineParser()
-            
-            installed_data = installed_parser.to_dict()
-            available_data = available_parser.to_dict()
-            
-            # Combine data using model
-            from .models import ExportData
-            export_data = ExportData(
-                installed_distributions=installed_data,
-                available_distributions=available_data,
-                summary={
-                    "installed_count": len(installed_data),
-                    "available_count": len(available_data)
-                }
-            )
-            
-            # Convert to JSON
-            json_output = json.dumps(export_data.__dict__, indent=2)
-            
-            self.status_callback("Data exported to JSON successfully")
-            callback(json_output)
-            
-        except Exception as e:
-            self.status_callback(f"Error exporting data: {e}")
-            messagebox.showerror("Error", f"Failed to export data:\n{e}")
-    
-    def show_rename_dialog(self, parent, current_name: str) -> Optional[str]:
+        """Export data to JSON format in the background."""
+        def export_thread():
+            try:
+                # Reuse the loaded lists; wsl.exe only runs if one isn't loaded
+                # yet, and then the two loads overlap
+                online = self._executor.submit(self._get_online)
+                installed = self._get_installed()
+                # If no worker has picked the online load up yet, do it here
+                # rather than wait for one
+                available = self._get_online() if online.cancel() else online.result()
+                
+                # orjson serializes the dataclasses itself, so the lists are
+                # encoded in one pass without converting them to dicts first
+                if orjson is not None:
+                    installed_data = installed.distributions
+                    available_data = available.distributions
+                else:
+                    installed_data = installed.to_dict()
+                    available_data = available.to_dict()
+                
+                # Combine data using model
+                from .models import ExportData
+                export_data = ExportData(
+                    installed_distributions=installed_data,
+                    available_distributions=available_data,
+                    summary={
+                        "installed_count": len(installed_data),
+                        "available_count": len(available_data)
+                    }
+                )
+                
+                # Convert to JSON
+                if orjson is not None:
+                    json_output = orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode()
+                else:
+                    import json  # Only needed for export without orjson
+                    
+                    # Non-ASCII left as is, as orjson writes it, so the output
+                    # doesn't depend on whether orjson is installed
+                    json_output = json.dumps(export_data.__dict__, indent=2, ensure_ascii=False)
+                
+                self._set_status("Data exported to JSON successfully")
+                self.ui_callback(callback, json_output)
+                
+            except Exception as e:
+                self._set_status(f"Error exporting data: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to export data:\n{e}")
+        
+        self._executor.submit(export_thread)
+    
+    def _get_name_dialog(self, parent, screen_size=None) -> NameDialog:
+        """Return the shared name dialog, creating it on first use."""
+        if self._name_dialog is None:
+            self._name_dialog = NameDialog(parent, screen_size)
+        else:
+            self._name_dialog.set_screen_size(screen_size)
+        return self._name_dialog
+    
+    def show_rename_dialog(self, parent, current_name: str, screen_size=None) -> Optional[str]:
         """Show rename dialog and return the new name."""
-        dialog = RenameDialog(parent, current_name)
-        return dialog.show()
+        return self._get_name_dialog(parent, screen_size).ask_rename(current_name)
     
-    def show_install_dialog(self, parent, dist_name: str, friendly_name: str) -> Optional[str]:
+    def show_install_dialog(self, parent, dist_name: str, friendly_name: str, screen_size=None) -> Optional[str]:
         """Show install dialog and return the custom name."""
-        dialog = InstallDialog(parent, dist_name, friendly_name)
-        return dialog.show()
+        return self._get_name_dialog(parent, screen_size).ask_install(dist_name, friendly_name)
     
     def show_help_dialog(self, parent):
         """Show help dialog."""
@@ -199,27 +332,32 @@ class WSLManagerActions:
     
     def launch_wsl_terminal(self, dist_name: str):
         """Launch a command prompt terminal in the specified WSL distribution."""
-        try:
-            self.status_callback(f"Launching terminal for distribution '{dist_name}'...")
-            
-            # Launch the command in a new window
-            # On Windows, we can use start to open a new command prompt window
-            if os.name == 'nt':  # Windows
-                # Clean the distribution name to remove any potential hidden characters
-                clean_dist_name = dist_name.strip()
-                
-                # Use the Windows start command with proper quoting
-                # This approach should work more reliably
-                start_cmd = f'start "WSL Terminal - {clean_dist_name}" cmd /k "wsl -d {clean_dist_name}"'
-                subprocess.Popen(start_cmd, shell=True)
-                
-            else:
-                # For other systems, just run the command directly
-                cmd = ['wsl', '-d', dist_name]
-                subprocess.Popen(cmd)
-            
-            self.status_callback(f"Terminal launched for distribution '{dist_name}'")
-            
-        except Exception as e:
-            self.status_callback(f"Error launching terminal: {e}")
-            messagebox.showerror("Error", f"Failed to launch terminal for distribution '{dist_name}':\n{e}")
+        self.status_callback(f"Launching terminal for distribution '{dist_name}'...")
+        
+        # Starting cmd.exe can take a noticeable moment, so spawn it from the
+        # pool like every other wsl.exe call instead of on the Tk thread
+        def launch_thread():
+            try:
+                # Launch the command in a new window
+                # On Windows, we can use start to open a new command prompt window
+                if os.name == 'nt':  # Windows
+                    # Clean the distribution name to remove any potential hidden characters
+                    clean_dist_name = dist_name.strip()
+                    
+                    # Use the Windows start command with proper quoting
+                    # This approach should work more reliably
+                    start_cmd = f'start "WSL Terminal - {clean_dist_name}" cmd /k "wsl -d {clean_dist_name}"'
+                    subprocess.Popen(start_cmd, shell=True)
+                    
+                else:
+                    # For other systems, just run the command directly
+                    cmd = ['wsl', '-d', dist_name]
+                    subprocess.Popen(cmd)
+                
+                self._set_status(f"Terminal launched for distribution '{dist_name}'")
+                
+            except Exception as e:
+                self._set_status(f"Error launching terminal: {e}")
+                self.ui_callback(messagebox.showerror, "Error", f"Failed to launch terminal for distribution '{dist_name}':\n{e}")
+        
+        self._executor.submit(launch_thread)
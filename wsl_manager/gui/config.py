@@ -2,11 +2,21 @@
 Configuration and constants for the GUI application.
 """
 
+from types import MappingProxyType
+
 # Window configuration
 WINDOW_TITLE = "Open WSL Manager"
-WINDOW_SIZE = "1000x700"  # Increased width for better table display
+WINDOW_WIDTH, WINDOW_HEIGHT = 1000, 700  # Increased width for better table display
+WINDOW_SIZE = f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}"
 MIN_WINDOW_SIZE = (1000, 600)  # Increased minimum width
 
+# How often (ms) the main loop runs UI updates queued by worker threads
+UI_POLL_INTERVAL = 50
+
+# Delay (ms) before reacting to a treeview selection change, so holding an
+# arrow key updates the buttons once instead of for every row passed
+SELECT_DEBOUNCE_DELAY = 40
+
 # Style configuration
 STYLES = {
     'title': 'Title.TLabel',
@@ -120,3 +130,11 @@ Commands:
 For command-line usage, run:
 python main.py help
 """
+
+# The shared tables are exposed read-only, so no widget can change them for
+# the others by accident
+STYLES = MappingProxyType(STYLES)
+FONTS = MappingProxyType(FONTS)
+COLORS = MappingProxyType(COLORS)
+INSTALLED_COLUMNS = MappingProxyType(INSTALLED_COLUMNS)
+AVAILABLE_COLUMNS = MappingProxyType(AVAILABLE_COLUMNS)
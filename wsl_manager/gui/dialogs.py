@@ -4,33 +4,57 @@ Dialog classes for the WSL Manager GUI.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Tuple
+from ..core.parser import is_valid_name
 from .config import DIALOG_CONFIGS, FONTS, STYLES
 
 
 class BaseDialog:
     """Base class for modal dialogs."""
     
-    def __init__(self, parent, title: str, size: str):
+    # Dialog button styles by button text
+    BUTTON_STYLES = {
+        'Rename': STYLES['success_button'],
+        'Install': STYLES['success_button'],
+        'Cancel': STYLES['secondary_button'],
+        'OK': STYLES['primary_button'],
+        'Yes': STYLES['success_button'],
+        'No': STYLES['secondary_button']
+    }
+    
+    def __init__(self, parent, title: str, size: str, screen_size: Optional[Tuple[int, int]] = None):
         self.parent = parent
         self.result = None
+        self.screen_size = screen_size  # (width, height), queried from Tk if None
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry(size)
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         self.dialog.configure(bg='white')  # Set dialog background to white
         
-        # Center the dialog
-        self.center_dialog()
+        # Size and center the dialog
+        if size:
+            self.dialog.geometry(self.centered_geometry(size))
         
         # Create main frame
         self.main_frame = ttk.Frame(self.dialog, padding="20")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
     
+    def centered_geometry(self, size: str) -> str:
+        """Return a geometry string centering a window of the given 'WxH' size.
+        
+        The size is known up front, so no layout pass is needed to measure it.
+        """
+        width, height = map(int, size.split('x'))
+        screen_width, screen_height = self.screen_size or (self.dialog.winfo_screenwidth(),
+                                                           self.dialog.winfo_screenheight())
+        x = (screen_width - width) // 2
+        y = (screen_height - height) // 2
+        return f"{size}+{x}+{y}"
+    
     def center_dialog(self):
         """Center the dialog on the parent window."""
         self.dialog.update_idletasks()
@@ -39,9 +63,13 @@ class BaseDialog:
         self.dialog.geometry(f"+{x}+{y}")
     
     def create_buttons_frame(self, buttons_config: list):
-        """Create a frame with buttons."""
+        """Create a frame with buttons.
+        
+        The buttons are kept in self.buttons, keyed by their 'name' (or text).
+        """
         buttons_frame = ttk.Frame(self.main_frame)
         buttons_frame.pack(fill=tk.X, pady=(10, 0))
+        self.buttons = {}
         
         for i, config in enumerate(buttons_config):
             # Determine button style based on button text
@@ -54,21 +82,13 @@ class BaseDialog:
                 style=button_style
             )
             button.pack(side=tk.RIGHT, padx=(5, 0) if i > 0 else (0, 0))
+            self.buttons[config.get('name', config['text'])] = button
         
         return buttons_frame
     
     def get_dialog_button_style(self, button_text: str) -> str:
         """Get the appropriate button style for dialog buttons."""
-        style_mapping = {
-            'Rename': STYLES['success_button'],
-            'Install': STYLES['success_button'],
-            'Cancel': STYLES['secondary_button'],
-            'OK': STYLES['primary_button'],
-            'Yes': STYLES['success_button'],
-            'No': STYLES['secondary_button']
-        }
-        
-        return style_mapping.get(button_text, STYLES['primary_button'])
+        return self.BUTTON_STYLES.get(button_text, STYLES['primary_button'])
     
     def show(self) -> Optional[Any]:
         """Show the dialog and return the result."""
@@ -76,154 +96,199 @@ class BaseDialog:
         return self.result
 
 
-class RenameDialog(BaseDialog):
-    """Dialog for renaming WSL distributions."""
+class NameDialog(BaseDialog):
+    """Modal dialog asking for a distribution name, used for rename and install.
+    
+    The window and its widgets are built once and kept hidden between uses;
+    each ask_* call only updates the texts and shows the window again.
+    """
     
-    def __init__(self, parent, current_name: str):
-        super().__init__(parent, DIALOG_CONFIGS['rename']['title'], DIALOG_CONFIGS['rename']['size'])
-        self.current_name = current_name
+    def __init__(self, parent, screen_size: Optional[Tuple[int, int]] = None):
+        super().__init__(parent, "", "", screen_size)
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        
+        self.validate = None
+        self.error = None  # Validation error for the current name, if any
+        self.done_var = tk.BooleanVar()
+        self.geometries = {}  # Centered geometry per DIALOG_CONFIGS key
         self.setup_dialog()
     
     def setup_dialog(self):
-        """Set up the rename dialog."""
+        """Set up the dialog widgets."""
+        self.header_var = tk.StringVar()
+        self.info_var = tk.StringVar()
+        self.prompt_var = tk.StringVar()
+        self.help_var = tk.StringVar()
+        self.note_var = tk.StringVar()
+        self.name_var = tk.StringVar()
+        
         # Title
-        title_label = ttk.Label(self.main_frame, text=f"Rename {self.current_name}", style='Header.TLabel')
-        title_label.pack(pady=(0, 10))
+        ttk.Label(self.main_frame, textvariable=self.header_var, style='Header.TLabel').pack(pady=(0, 10))
         
-        # Current name label
-        current_label = ttk.Label(self.main_frame, text=f"Current name: {self.current_name}")
-        current_label.pack(pady=(0, 10))
+        # Info label
+        ttk.Label(self.main_frame, textvariable=self.info_var).pack(pady=(0, 10))
         
-        # New name frame
+        # Name frame
         name_frame = ttk.Frame(self.main_frame)
         name_frame.pack(fill=tk.X, pady=(0, 20))
         
-        ttk.Label(name_frame, text="New name:").pack(anchor=tk.W)
-        self.new_name_var = tk.StringVar()
-        self.new_name_entry = ttk.Entry(name_frame, textvariable=self.new_name_var, width=30)
-        self.new_name_entry.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(name_frame, textvariable=self.prompt_var).pack(anchor=tk.W)
+        self.name_entry = ttk.Entry(name_frame, textvariable=self.name_var, width=30)
+        self.name_entry.pack(fill=tk.X, pady=(5, 0))
         
         # Help text
-        help_label = ttk.Label(name_frame, text="Name can only contain letters, numbers, hyphens, and underscores", font=FONTS['help'])
-        help_label.pack(anchor=tk.W, pady=(2, 0))
+        ttk.Label(name_frame, textvariable=self.help_var, font=FONTS['help']).pack(anchor=tk.W, pady=(2, 0))
         
-        # Note about rename process
-        note_label = ttk.Label(name_frame, text="Note: Renaming uses export/import process (may take a few minutes)", font=FONTS['help'], foreground='gray')
-        note_label.pack(anchor=tk.W, pady=(2, 0))
+        # Note about the process
+        ttk.Label(name_frame, textvariable=self.note_var, font=FONTS['help'], foreground='gray').pack(anchor=tk.W, pady=(2, 0))
         
-        # Buttons
+        # Buttons; the confirm button's text is set per use
         buttons_config = [
-            {'text': 'Rename', 'command': self.on_rename},
+            {'name': 'confirm', 'text': 'OK', 'command': self.on_confirm},
             {'text': 'Cancel', 'command': self.on_cancel}
         ]
         self.create_buttons_frame(buttons_config)
         
-        # Focus on the entry field
-        self.new_name_entry.focus()
-        
         # Handle Enter key
-        self.new_name_entry.bind('<Return>', lambda e: self.on_rename())
-    
-    def on_rename(self):
-        """Handle rename button click."""
-        new_name = self.new_name_var.get().strip()
-        if not new_name:
-            messagebox.showerror("Invalid Name", "Please enter a new name.")
-            return
+        self.name_entry.bind('<Return>', lambda e: self.on_confirm())
         
-        if new_name == self.current_name:
-            messagebox.showerror("Invalid Name", "New name must be different from current name.")
-            return
-        
-        # Validate new name (basic validation)
-        if not new_name.replace('-', '').replace('_', '').isalnum():
-            messagebox.showerror("Invalid Name", "New name can only contain letters, numbers, hyphens, and underscores.")
-            return
-        
-        self.result = new_name
-        self.dialog.destroy()
-    
-    def on_cancel(self):
-        """Handle cancel button click."""
-        self.result = None
-        self.dialog.destroy()
-
-
-class InstallDialog(BaseDialog):
-    """Dialog for installing WSL distributions with custom names."""
+        # Validate as the name is typed rather than on submit
+        self.name_var.trace_add('write', self.revalidate)
     
-    def __init__(self, parent, dist_name: str, friendly_name: str):
-        super().__init__(parent, DIALOG_CONFIGS['install']['title'], DIALOG_CONFIGS['install']['size'])
-        self.dist_name = dist_name
-        self.friendly_name = friendly_name
-        self.setup_dialog()
+    def set_screen_size(self, screen_size: Optional[Tuple[int, int]]):
+        """Update the screen size used for centering, dropping stale geometries."""
+        if screen_size != self.screen_size:
+            self.screen_size = screen_size
+            self.geometries.clear()
     
-    def setup_dialog(self):
-        """Set up the install dialog."""
-        # Title
-        title_label = ttk.Label(self.main_frame, text=f"Install {self.friendly_name}", style='Header.TLabel')
-        title_label.pack(pady=(0, 10))
+    def ask_rename(self, current_name: str) -> Optional[str]:
+        """Ask for a new name for current_name; returns None if cancelled."""
+        def validate(new_name):
+            if not new_name:
+                return "Please enter a new name."
+            if new_name == current_name:
+                return "New name must be different from current name."
+            if not is_valid_name(new_name):
+                return "New name can only contain letters, numbers, hyphens, and underscores."
+            return None
         
-        # Info label
-        info_label = ttk.Label(self.main_frame, text=f"Distribution: {self.dist_name}")
-        info_label.pack(pady=(0, 10))
-        
-        # Custom name frame
-        name_frame = ttk.Frame(self.main_frame)
-        name_frame.pack(fill=tk.X, pady=(0, 20))
+        return self.ask('rename', f"Rename {current_name}", f"Current name: {current_name}",
+                        "New name:", "Name can only contain letters, numbers, hyphens, and underscores",
+                        "Note: Renaming uses export/import process (may take a few minutes)",
+                        'Rename', validate)
+    
+    def ask_install(self, dist_name: str, friendly_name: str) -> Optional[str]:
+        """Ask for an optional custom name; returns "" for the default name and None if cancelled."""
+        def validate(custom_name):
+            if custom_name and not is_valid_name(custom_name):
+                return "Custom name can only contain letters, numbers, hyphens, and underscores."
+            return None
         
-        ttk.Label(name_frame, text="Custom Name (optional):").pack(anchor=tk.W)
-        self.custom_name_var = tk.StringVar()
-        self.custom_name_entry = ttk.Entry(name_frame, textvariable=self.custom_name_var, width=30)
-        self.custom_name_entry.pack(fill=tk.X, pady=(5, 0))
+        return self.ask('install', f"Install {friendly_name}", f"Distribution: {dist_name}",
+                        "Custom Name (optional):", "Leave empty to use default name",
+                        "Note: Custom naming uses export/import process (may take longer)",
+                        'Install', validate)
+    
+    def ask(self, config_key: str, header: str, info: str, prompt: str, help_text: str,
+            note: str, confirm_text: str, validate: Callable[[str], Optional[str]]) -> Optional[str]:
+        """Show the dialog with the given texts and wait for a result.
         
-        # Help text
-        help_label = ttk.Label(name_frame, text="Leave empty to use default name", font=FONTS['help'])
-        help_label.pack(anchor=tk.W, pady=(2, 0))
+        validate takes the stripped name and returns an error message or None.
+        """
+        config = DIALOG_CONFIGS[config_key]
+        if config_key not in self.geometries:
+            self.geometries[config_key] = self.centered_geometry(config['size'])
+        self.dialog.title(config['title'])
+        self.dialog.geometry(self.geometries[config_key])
+        self.header_var.set(header)
+        self.info_var.set(info)
+        self.prompt_var.set(prompt)
+        self.help_var.set(help_text)
+        self.note_var.set(note)
+        self.buttons['confirm'].config(text=confirm_text, style=self.get_dialog_button_style(confirm_text))
+        self.validate = validate
+        self.name_var.set("")
+        self.result = None
         
-        # Note about custom naming process
-        note_label = ttk.Label(name_frame, text="Note: Custom naming uses export/import process (may take longer)", font=FONTS['help'], foreground='gray')
-        note_label.pack(anchor=tk.W, pady=(2, 0))
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.name_entry.focus()
         
-        # Buttons
-        buttons_config = [
-            {'text': 'Install', 'command': self.on_install},
-            {'text': 'Cancel', 'command': self.on_cancel}
-        ]
-        self.create_buttons_frame(buttons_config)
+        self.done_var.set(False)
+        self.dialog.wait_variable(self.done_var)
         
-        # Focus on the entry field
-        self.custom_name_entry.focus()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        return self.result
+    
+    def revalidate(self, *args):
+        """Validate the name after each edit and enable the confirm button to match."""
+        if self.validate is None:
+            return
+        self.error = self.validate(self.name_var.get().strip())
+        self.buttons['confirm'].state(['disabled'] if self.error else ['!disabled'])
+    
+    def on_confirm(self):
+        """Handle confirm button click."""
+        # The button is disabled while the name is invalid, but Enter in the
+        # entry still gets here, so explain why nothing happens
+        if self.error:
+            messagebox.showerror("Invalid Name", self.error, parent=self.dialog)
+            return
         
-        # Handle Enter key
-        self.custom_name_entry.bind('<Return>', lambda e: self.on_install())
-    
-    def on_install(self):
-        """Handle install button click."""
-        custom_name = self.custom_name_var.get().strip()
-        if custom_name:
-            # Validate custom name (basic validation)
-            if not custom_name.replace('-', '').replace('_', '').isalnum():
-                messagebox.showerror("Invalid Name", "Custom name can only contain letters, numbers, hyphens, and underscores.")
-                return
-            self.result = custom_name
-        else:
-            self.result = ""  # Empty string means use default
-        self.dialog.destroy()
+        self.result = self.name_var.get().strip()
+        self.done_var.set(True)
     
     def on_cancel(self):
         """Handle cancel button click."""
         self.result = None
-        self.dialog.destroy()
+        self.done_var.set(True)
 
 
 class HelpDialog:
-    """Help dialog for the application."""
+    """Help window for the application.
+    
+    The window is built on first use and only hidden when closed, so
+    opening the help again just shows it instead of laying it out anew.
+    """
     
     def __init__(self, parent):
         self.parent = parent
+        self.window = None
     
     def show(self):
         """Show the help dialog."""
+        if self.window is None or not self.window.dialog.winfo_exists():
+            self.window = self.create_window()
+        self.window.dialog.deiconify()
+        self.window.dialog.lift()
+        self.window.dialog.focus_set()
+    
+    def create_window(self) -> BaseDialog:
+        """Build the hidden help window."""
         from .config import HELP_TEXT
-        messagebox.showinfo("WSL Manager Help", HELP_TEXT)
+        
+        window = BaseDialog(self.parent, "WSL Manager Help", "")
+        window.dialog.grab_release()
+        window.dialog.withdraw()
+        window.dialog.protocol("WM_DELETE_WINDOW", window.dialog.withdraw)
+        window.dialog.bind('<Escape>', lambda e: window.dialog.withdraw())
+        
+        # The text goes in with a single insert and is then made read-only
+        help_text = HELP_TEXT.strip()
+        text = tk.Text(window.main_frame, font=FONTS['status'], wrap=tk.WORD, relief=tk.FLAT,
+                       width=max(map(len, help_text.splitlines())) + 2,
+                       height=help_text.count('\n') + 1)
+        text.insert('1.0', help_text)
+        text.configure(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        window.create_buttons_frame([{'text': 'OK', 'command': window.dialog.withdraw}])
+        
+        # The window was never shown, so center it using its requested size
+        window.dialog.update_idletasks()
+        size = f"{window.dialog.winfo_reqwidth()}x{window.dialog.winfo_reqheight()}"
+        window.dialog.geometry(window.centered_geometry(size))
+        return window
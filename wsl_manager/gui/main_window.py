@@ -2,15 +2,54 @@
 Main window class for the WSL Manager GUI.
 """
 
+import queue
 import tkinter as tk
 from tkinter import ttk
-from .config import WINDOW_TITLE, WINDOW_SIZE, MIN_WINDOW_SIZE, STYLES, FONTS, COLORS
+from .config import WINDOW_TITLE, WINDOW_SIZE, MIN_WINDOW_SIZE, UI_POLL_INTERVAL, STYLES, FONTS, COLORS
 from .tabs import InstalledTab, AvailableTab, ActionsTab
 from .widgets import StatusBar
 from .actions import WSLManagerActions
 from .models import DistributionViewModel, TabState
 
 
+class StyleScript:
+    """Collects ttk style configure/map calls to send to Tcl in one go.
+    
+    It takes the place of a ttk.Style in the setup_*_styles methods; run()
+    then applies all the recorded commands in a single Tcl call instead of
+    making one interpreter round trip per call.
+    """
+    
+    # Tcl lambda running each recorded argument list as a ttk::style command
+    _APPLY_STYLES = '{cmds} {foreach cmd $cmds {ttk::style {*}$cmd}}'
+    
+    def __init__(self):
+        self.commands = []
+    
+    def configure(self, style: str, **kw):
+        # Kept as argument tuples, which tkinter passes to Tcl as lists, so
+        # values such as fonts need no quoting here
+        args = ['configure', style]
+        for option, value in kw.items():
+            args += ('-' + option, value)
+        self.commands.append(tuple(args))
+    
+    def map(self, style: str, **kw):
+        # Each value is a list of (state..., value) specs, as for ttk.Style.map
+        args = ['map', style]
+        for option, specs in kw.items():
+            flat = []
+            for *states, value in specs:
+                flat += (states[0] if len(states) == 1 else tuple(states), value)
+            args += ('-' + option, tuple(flat))
+        self.commands.append(tuple(args))
+    
+    def run(self, widget):
+        """Apply the recorded commands in widget's interpreter."""
+        widget.tk.call('apply', self._APPLY_STYLES, tuple(self.commands))
+        self.commands = []
+
+
 class WSLManagerGUI:
     """Main GUI application for WSL Manager."""
     
@@ -24,9 +63,19 @@ class WSLManagerGUI:
         # Initialize data models
         self.view_model = DistributionViewModel()
         self.tab_state = TabState()
+        self._available_requested = False  # Whether the available list was asked for yet
+        
+        # Tk is not thread-safe: worker threads queue UI updates here and the
+        # main loop runs them (see call_in_ui)
+        self._ui_queue = queue.Queue()
+        self.root.after(UI_POLL_INTERVAL, self._drain_ui_queue)
         
         # Initialize actions handler
-        self.actions = WSLManagerActions(self.set_status)
+        self.actions = WSLManagerActions(self.set_status, self.call_in_ui)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Start 'wsl -l -v' now so it overlaps building the widgets
+        self.actions.prefetch()
         
         # Configure style
         self.setup_styles()
@@ -34,13 +83,25 @@ class WSLManagerGUI:
         # Create main interface
         self.create_widgets()
         
-        # Load initial data
-        self.refresh_data()
+        # Load initial data (from the prefetch started above). The available
+        # list, a network query, is only loaded once its tab is first
+        # selected (see on_tab_changed)
+        self.refresh_installed(force=False)
     
     def setup_styles(self):
-        """Configure the application styles."""
-        style = ttk.Style()
-        style.theme_use('clam')
+        """Configure the application styles.
+        
+        ttk styles belong to the Tk interpreter, so this only does the work
+        for the first window created on a given root.
+        """
+        if getattr(self.root, '_wsl_manager_styled', False):
+            return
+        self.root._wsl_manager_styled = True
+        
+        ttk.Style(self.root).theme_use('clam')
+        
+        # The styles below are recorded and applied in a single Tcl call
+        style = StyleScript()
         
         # Configure colors with white backgrounds
         style.configure(STYLES['title'], font=FONTS['title'], background='white')
@@ -72,68 +133,37 @@ class WSLManagerGUI:
                        relief='solid')
         style.map('Treeview.Heading',
                  background=[('active', COLORS['tab_border'])])
+        
+        style.run(self.root)
     
     def setup_button_styles(self, style):
         """Configure modern button styles with hover effects."""
-        # Primary button (blue)
-        style.configure(STYLES['primary_button'],
-                       font=FONTS['button'],
-                       background=COLORS['primary'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8))
-        
-        style.map(STYLES['primary_button'],
-                 background=[('active', COLORS['primary_hover']),
-                           ('pressed', COLORS['primary_hover']),
-                           ('disabled', COLORS['secondary'])],
-                 foreground=[('disabled', COLORS['button_text_disabled'])])
-        
-        # Secondary button (gray)
-        style.configure(STYLES['secondary_button'],
-                       font=FONTS['button'],
-                       background=COLORS['secondary'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8))
-        
-        style.map(STYLES['secondary_button'],
-                 background=[('active', COLORS['secondary_hover']),
-                           ('pressed', COLORS['secondary_hover']),
-                           ('disabled', COLORS['border'])],
-                 foreground=[('disabled', COLORS['button_text_disabled'])])
-        
-        # Success button (green)
-        style.configure(STYLES['success_button'],
-                       font=FONTS['button'],
-                       background=COLORS['success'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8))
-        
-        style.map(STYLES['success_button'],
-                 background=[('active', COLORS['success_hover']),
-                           ('pressed', COLORS['success_hover']),
-                           ('disabled', COLORS['border'])],
-                 foreground=[('disabled', COLORS['button_text_disabled'])])
+        # Shared by every button style, so looked up once
+        font = FONTS['button']
+        disabled_foreground = COLORS['button_text_disabled']
+        
+        # Style, background, hover/pressed background, disabled background
+        buttons = (
+            (STYLES['primary_button'], COLORS['primary'], COLORS['primary_hover'], COLORS['secondary']),        # Blue
+            (STYLES['secondary_button'], COLORS['secondary'], COLORS['secondary_hover'], COLORS['border']),  # Gray
+            (STYLES['success_button'], COLORS['success'], COLORS['success_hover'], COLORS['border']),        # Green
+            (STYLES['danger_button'], COLORS['danger'], COLORS['danger_hover'], COLORS['border']),           # Red
+        )
         
-        # Danger button (red)
-        style.configure(STYLES['danger_button'],
-                       font=FONTS['button'],
-                       background=COLORS['danger'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8))
-        
-        style.map(STYLES['danger_button'],
-                 background=[('active', COLORS['danger_hover']),
-                           ('pressed', COLORS['danger_hover']),
-                           ('disabled', COLORS['border'])],
-                 foreground=[('disabled', COLORS['button_text_disabled'])])
+        for name, background, hover, disabled in buttons:
+            style.configure(name,
+                           font=font,
+                           background=background,
+                           foreground='white',
+                           borderwidth=0,
+                           focuscolor='none',
+                           padding=(12, 8))
+            
+            style.map(name,
+                     background=[('active', hover),
+                               ('pressed', hover),
+                               ('disabled', disabled)],
+                     foreground=[('disabled', disabled_foreground)])
     
     def setup_tab_styles(self, style):
         """Configure modern tab styles."""
@@ -162,19 +192,11 @@ class WSLManagerGUI:
                        borderwidth=0,
                        relief='flat')
         
-        # Ensure all standard frames have white background
-        style.configure('TFrame',
-                       background='white')
-        
-        # Configure all label types with white backgrounds
-        style.configure('TLabel',
-                       background='white')
-        style.configure('Title.TLabel',
-                       background='white')
-        style.configure('Header.TLabel',
-                       background='white')
-        style.configure('Status.TLabel',
-                       background='white')
+        # Ensure standard frames, labels, text and scrollbars have a white
+        # background; the Title, Header and Status label styles derive from
+        # TLabel and were set up above
+        for name in ('TFrame', 'TLabel', 'TText', 'TScrollbar'):
+            style.configure(name, background='white')
         
         # Configure LabelFrame with white background
         style.configure('TLabelframe',
@@ -186,17 +208,9 @@ class WSLManagerGUI:
                        foreground=COLORS['text'],
                        background='white')
         
-        # Configure Entry and other text components with white backgrounds
-        style.configure('TEntry',
-                       background='white',
-                       fieldbackground='white')
-        style.configure('TCombobox',
-                       background='white',
-                       fieldbackground='white')
-        style.configure('TText',
-                       background='white')
-        style.configure('TScrollbar',
-                       background='white')
+        # Configure Entry and Combobox fields with white backgrounds
+        for name in ('TEntry', 'TCombobox'):
+            style.configure(name, background='white', fieldbackground='white')
     
     def create_widgets(self):
         """Create the main GUI widgets."""
@@ -253,51 +267,95 @@ class WSLManagerGUI:
             on_show_help=self.show_help
         )
         self.notebook.add(self.actions_tab, text="Actions & Info")
+        
+        # Only the installed tab is built up front; the others are built
+        # the first time they are selected
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+    
+    def on_tab_changed(self, event):
+        """Build the newly selected tab's widgets on its first showing.
+        
+        The first showing of the Available tab also runs the first
+        'wsl --list --online' of the session.
+        """
+        tab = self.notebook.nametowidget(self.notebook.select())
+        tab.ensure_ui()
+        if tab is self.available_tab and not self._available_requested:
+            self.refresh_available(force=False)
+    
+    def on_close(self):
+        """Stop taking background work and close the window."""
+        self.actions.shutdown()
+        self.root.destroy()
+    
+    def call_in_ui(self, func, *args):
+        """Schedule func(*args) to run on the Tk main thread."""
+        self._ui_queue.put((func, args))
+    
+    def _drain_ui_queue(self):
+        """Run the UI updates queued by worker threads.
+        
+        Everything queued runs within this one callback, so Tk redraws once
+        when it is idle afterwards. The updates must not call update(), which
+        would redraw and handle events in the middle of them.
+        """
+        try:
+            while True:
+                func, args = self._ui_queue.get_nowait()
+                func(*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(UI_POLL_INTERVAL, self._drain_ui_queue)
+    
+    def get_screen_size(self):
+        """Return the (width, height) of the screen, used to center windows.
+        
+        Not cached: Tk has no event for the screen changing, and <Configure>
+        fires on every move and resize, so a cache would rarely be hit.
+        """
+        return (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
     
     def set_status(self, message: str):
         """Set the status bar message."""
         self.status_bar.set_status(message)
     
-    def refresh_installed(self):
+    def refresh_installed(self, force: bool = True):
         """Refresh installed distributions data."""
-        def update_ui(distributions, summary):
+        def update_ui(distributions, rows, summary):
             # Update view model
             self.view_model.update_installed(distributions)
             
-            # Clear existing data
-            self.installed_tab.clear_data()
-            
-            # Add new data
-            for dist in distributions:
-                self.installed_tab.add_distribution(dist.name, dist.state, dist.version, dist.is_default)
+            # Replace the rows in one batch
+            self.installed_tab.set_rows(rows)
             
             # Update summary
             self.installed_tab.set_summary(summary)
         
-        self.actions.refresh_installed_distributions(update_ui)
+        self.actions.refresh_installed_distributions(update_ui, force)
     
-    def refresh_available(self):
+    def refresh_available(self, force: bool = True):
         """Refresh available distributions data."""
-        def update_ui(distributions, summary):
+        self._available_requested = True
+        
+        def update_ui(distributions, rows, summary):
             # Update view model
             self.view_model.update_available(distributions)
             
-            # Clear existing data
-            self.available_tab.clear_data()
-            
-            # Add new data
-            for dist in distributions:
-                self.available_tab.add_distribution(dist.name, dist.friendly_name)
+            # Replace the rows in one batch
+            self.available_tab.set_rows(rows)
             
             # Update summary
             self.available_tab.set_summary(summary)
         
-        self.actions.refresh_available_distributions(update_ui)
+        self.actions.refresh_available_distributions(update_ui, force)
     
-    def refresh_data(self):
+    def refresh_data(self, force: bool = True):
         """Refresh all data."""
-        self.refresh_installed()
-        self.refresh_available()
+        # Both refreshes go to the actions thread pool right away, so the two
+        # wsl.exe processes run (and pay their start-up cost) concurrently
+        self.refresh_installed(force)
+        self.refresh_available(force)
     
     def export_to_json(self):
         """Export data to JSON format."""
@@ -326,7 +384,8 @@ class WSLManagerGUI:
         )
         
         if result:
-            self.actions.delete_distribution(dist_name, self.refresh_installed)
+            # The parser reloads the list after the change, so reuse that
+            self.actions.delete_distribution(dist_name, lambda: self.refresh_installed(force=False))
     
     def rename_selected_distribution(self):
         """Rename the selected WSL distribution."""
@@ -336,7 +395,7 @@ class WSLManagerGUI:
             return
         
         # Show rename dialog
-        new_name = self.actions.show_rename_dialog(self.root, dist_name)
+        new_name = self.actions.show_rename_dialog(self.root, dist_name, self.get_screen_size())
         if new_name is None:  # User cancelled
             return
         
@@ -349,7 +408,8 @@ class WSLManagerGUI:
         )
         
         if result:
-            self.actions.rename_distribution(dist_name, new_name, self.refresh_installed)
+            # The parser reloads the list after the change, so reuse that
+            self.actions.rename_distribution(dist_name, new_name, lambda: self.refresh_installed(force=False))
     
     def install_selected_distribution(self):
         """Install the selected WSL distribution with optional custom name."""
@@ -361,7 +421,8 @@ class WSLManagerGUI:
         dist_name, friendly_name = selection
         
         # Show custom name dialog
-        custom_name = self.actions.show_install_dialog(self.root, dist_name, friendly_name)
+        custom_name = self.actions.show_install_dialog(self.root, dist_name, friendly_name,
+                                                       self.get_screen_size())
         if custom_name is None:  # User cancelled
             return
         
@@ -379,8 +440,9 @@ class WSLManagerGUI:
         
         if result:
             def refresh_both():
+                # Installing doesn't change the online list, so reuse it
                 self.refresh_installed()
-                self.refresh_available()
+                self.refresh_available(force=False)
             
             self.actions.install_distribution(dist_name, friendly_name, custom_name, refresh_both)
     
@@ -3,26 +3,90 @@ Data models and view models for the WSL Manager GUI.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from ..core.parser import WSLDistribution
 from ..core.online_parser import WSLOnlineDistribution
 
+# Keywords marking enterprise distributions (see get_enterprise_distributions)
+ENTERPRISE_KEYWORDS = ('enterprise', 'oracle', 'suse')
+
+
+# Text for the installed tab's Default column, indexed by is_default
+_YES_NO = ("No", "Yes")
+
+
+def installed_rows(distributions: List[WSLDistribution]) -> List[Tuple[str, str, str, str]]:
+    """Build the installed tab's treeview rows (name, state, version, default)."""
+    return [(d.name, d.state, d.version, _YES_NO[d.is_default]) for d in distributions]
+
+
+def available_rows(distributions: List[WSLOnlineDistribution]) -> List[Tuple[str, str, str]]:
+    """Build the available tab's treeview rows (name, friendly name, install command)."""
+    return [(d.name, d.friendly_name, f"wsl --install {d.name}") for d in distributions]
+
 
 @dataclass
 class DistributionSummary:
     """Summary information for distributions."""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('total', 'running', 'stopped', 'default_name')
+    
     total: int
     running: int
     stopped: int
     default_name: str
+    
+    @classmethod
+    def from_distributions(cls, distributions: List[WSLDistribution]) -> 'DistributionSummary':
+        """Build the summary in a single pass over the distributions."""
+        running = stopped = 0
+        default_name = "None"
+        for dist in distributions:
+            state = dist.state.lower()
+            if state == 'running':
+                running += 1
+            elif state == 'stopped':
+                stopped += 1
+            if dist.is_default and default_name == "None":
+                default_name = dist.name
+        return cls(len(distributions), running, stopped, default_name)
+    
+    def __str__(self) -> str:
+        return f"Total: {self.total} | Running: {self.running} | Stopped: {self.stopped} | Default: {self.default_name}"
 
 
 @dataclass
 class AvailableDistributionSummary:
     """Summary information for available distributions."""
+    __slots__ = ('total', 'ubuntu_count', 'enterprise_count')
+    
     total: int
     ubuntu_count: int
     enterprise_count: int
+    
+    @classmethod
+    def from_distributions(cls, distributions: List[WSLOnlineDistribution]) -> 'AvailableDistributionSummary':
+        """Build the summary in a single pass over the distributions.
+        
+        Matches WSLOnlineParser.get_ubuntu_distributions() and
+        get_enterprise_distributions().
+        """
+        ubuntu_count = enterprise_count = 0
+        for dist in distributions:
+            # Lowercase each field once; plain loops avoid building a joined
+            # string and a generator per distribution
+            name = dist.name.lower()
+            friendly_name = dist.friendly_name.lower()
+            if 'ubuntu' in name or 'ubuntu' in friendly_name:
+                ubuntu_count += 1
+            for keyword in ENTERPRISE_KEYWORDS:
+                if keyword in name or keyword in friendly_name:
+                    enterprise_count += 1
+                    break
+        return cls(len(distributions), ubuntu_count, enterprise_count)
+    
+    def __str__(self) -> str:
+        return f"Total: {self.total} | Ubuntu variants: {self.ubuntu_count} | Enterprise: {self.enterprise_count}"
 
 
 @dataclass
@@ -39,41 +103,32 @@ class DistributionViewModel:
     def __init__(self):
         self.installed_distributions: List[WSLDistribution] = []
         self.available_distributions: List[WSLOnlineDistribution] = []
+        # Name lookups, built on first use after each update (see find_*)
+        self._installed_by_name: Optional[Dict[str, WSLDistribution]] = None
+        self._available_by_name: Optional[Dict[str, WSLOnlineDistribution]] = None
     
     def update_installed(self, distributions: List[WSLDistribution]):
         """Update installed distributions data."""
         self.installed_distributions = distributions
+        self._installed_by_name = None
     
     def update_available(self, distributions: List[WSLOnlineDistribution]):
         """Update available distributions data."""
         self.available_distributions = distributions
+        self._available_by_name = None
     
     def get_installed_summary(self) -> DistributionSummary:
         """Get summary of installed distributions."""
-        total = len(self.installed_distributions)
-        running = len([d for d in self.installed_distributions if d.state.lower() == 'running'])
-        stopped = len([d for d in self.installed_distributions if d.state.lower() == 'stopped'])
-        default_dist = next((d for d in self.installed_distributions if d.is_default), None)
-        default_name = default_dist.name if default_dist else "None"
-        
-        return DistributionSummary(total, running, stopped, default_name)
+        return DistributionSummary.from_distributions(self.installed_distributions)
     
     def get_available_summary(self) -> AvailableDistributionSummary:
         """Get summary of available distributions."""
-        total = len(self.available_distributions)
-        ubuntu_count = len([d for d in self.available_distributions if 'ubuntu' in d.name.lower()])
-        enterprise_count = len([d for d in self.available_distributions 
-                               if any(keyword in d.name.lower() or keyword in d.friendly_name.lower() 
-                                     for keyword in ['enterprise', 'oracle', 'suse'])])
-        
-        return AvailableDistributionSummary(total, ubuntu_count, enterprise_count)
+        return AvailableDistributionSummary.from_distributions(self.available_distributions)
     
     def get_export_data(self) -> ExportData:
         """Get data for JSON export."""
-        from dataclasses import asdict
-        
-        installed_data = [asdict(dist) for dist in self.installed_distributions]
-        available_data = [asdict(dist) for dist in self.available_distributions]
+        installed_data = [dist.to_dict() for dist in self.installed_distributions]
+        available_data = [dist.to_dict() for dist in self.available_distributions]
         
         summary = {
             "installed_count": len(installed_data),
@@ -84,16 +139,23 @@ class DistributionViewModel:
     
     def find_installed_by_name(self, name: str) -> Optional[WSLDistribution]:
         """Find an installed distribution by name."""
-        return next((d for d in self.installed_distributions if d.name == name), None)
+        if self._installed_by_name is None:
+            # Built from the end so the first of any duplicate names wins
+            self._installed_by_name = {d.name: d for d in reversed(self.installed_distributions)}
+        return self._installed_by_name.get(name)
     
     def find_available_by_name(self, name: str) -> Optional[WSLOnlineDistribution]:
-        """Find an available distribution by name."""
-        return next((d for d in self.available_distributions if d.name.lower() == name.lower()), None)
+        """Find an available distribution by name, ignoring case."""
+        if self._available_by_name is None:
+            self._available_by_name = {d.name.lower(): d for d in reversed(self.available_distributions)}
+        return self._available_by_name.get(name.lower())
 
 
 class TabState:
     """State management for tabs."""
     
+    __slots__ = ('selected_installed', 'selected_available', 'is_loading_installed', 'is_loading_available')
+    
     def __init__(self):
         self.selected_installed: Optional[str] = None
         self.selected_available: Optional[tuple] = None
@@ -7,6 +7,7 @@ from tkinter import ttk
 from typing import Callable, Optional
 from .widgets import DistributionTreeView, ActionButtons, SummaryFrame, TabFrame
 from .config import INSTALLED_COLUMNS, AVAILABLE_COLUMNS, STYLES
+from .models import installed_rows, available_rows
 
 
 class InstalledTab(TabFrame):
@@ -19,7 +20,8 @@ class InstalledTab(TabFrame):
         self.on_delete = on_delete
         self.on_launch_terminal = on_launch_terminal
         
-        self.setup_ui()
+        # Shown on launch, so its widgets are built right away
+        self.ensure_ui()
     
     def setup_ui(self):
         """Set up the installed distributions tab UI."""
@@ -69,6 +71,10 @@ class InstalledTab(TabFrame):
     
     def on_selection_change(self, event):
         """Handle treeview selection change."""
+        self.debounce(self.update_button_states)
+    
+    def update_button_states(self):
+        """Enable the rename and delete buttons when a distribution is selected."""
         selection = self.treeview.selection()
         if selection:
             self.action_buttons.set_button_state('rename', 'normal')
@@ -83,7 +89,7 @@ class InstalledTab(TabFrame):
             # Get the item that was double-clicked
             item = self.treeview.identify_row(event.y)
             if item:
-                values = self.treeview.item(item, 'values')
+                values = self.treeview.get_row(item)
                 if values and len(values) > 0:
                     dist_name = values[0]  # Name is the first column
                     if dist_name and dist_name.strip():  # Make sure it's not empty
@@ -93,20 +99,26 @@ class InstalledTab(TabFrame):
         """Get the name of the selected distribution."""
         selection = self.treeview.selection()
         if selection:
-            item = selection[0]
-            values = self.treeview.item(item, 'values')
+            values = self.treeview.get_row(selection[0])
             return values[0]  # Name is the first column
         return None
     
     def clear_data(self):
         """Clear all data from the treeview."""
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
+        self.treeview.set_rows([])
     
     def add_distribution(self, name: str, state: str, version: str, is_default: bool):
         """Add a distribution to the treeview."""
         default_text = "Yes" if is_default else "No"
-        self.treeview.insert('', 'end', values=(name, state, version, default_text))
+        self.treeview.add_row((name, state, version, default_text))
+    
+    def set_distributions(self, distributions):
+        """Replace the treeview contents with the given distributions."""
+        self.set_rows(installed_rows(distributions))
+    
+    def set_rows(self, rows):
+        """Replace the treeview contents with prebuilt rows (see installed_rows)."""
+        self.treeview.set_rows(rows)
     
     def set_summary(self, text: str):
         """Set the summary text."""
@@ -121,7 +133,7 @@ class AvailableTab(TabFrame):
         self.on_refresh = on_refresh
         self.on_install = on_install
         
-        self.setup_ui()
+        # Widgets are built when the tab is first shown or given data
     
     def setup_ui(self):
         """Set up the available distributions tab UI."""
@@ -162,6 +174,10 @@ class AvailableTab(TabFrame):
     
     def on_selection_change(self, event):
         """Handle treeview selection change."""
+        self.debounce(self.update_button_states)
+    
+    def update_button_states(self):
+        """Enable the install button when a distribution is selected."""
         selection = self.treeview.selection()
         if selection:
             self.action_buttons.set_button_state('install', 'normal')
@@ -172,23 +188,33 @@ class AvailableTab(TabFrame):
         """Get the name and friendly name of the selected distribution."""
         selection = self.treeview.selection()
         if selection:
-            item = selection[0]
-            values = self.treeview.item(item, 'values')
+            values = self.treeview.get_row(selection[0])
             return values[0], values[1]  # Name and friendly name
         return None
     
     def clear_data(self):
         """Clear all data from the treeview."""
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
+        self.ensure_ui()
+        self.treeview.set_rows([])
     
     def add_distribution(self, name: str, friendly_name: str):
         """Add a distribution to the treeview."""
+        self.ensure_ui()
         install_cmd = f"wsl --install {name}"
-        self.treeview.insert('', 'end', values=(name, friendly_name, install_cmd))
+        self.treeview.add_row((name, friendly_name, install_cmd))
+    
+    def set_distributions(self, distributions):
+        """Replace the treeview contents with the given distributions."""
+        self.set_rows(available_rows(distributions))
+    
+    def set_rows(self, rows):
+        """Replace the treeview contents with prebuilt rows (see available_rows)."""
+        self.ensure_ui()
+        self.treeview.set_rows(rows)
     
     def set_summary(self, text: str):
         """Set the summary text."""
+        self.ensure_ui()
         self.summary_frame.set_summary(text)
 
 
@@ -201,7 +227,7 @@ class ActionsTab(TabFrame):
         self.on_export_json = on_export_json
         self.on_show_help = on_show_help
         
-        self.setup_ui()
+        # Widgets are built when the tab is first shown
     
     def setup_ui(self):
         """Set up the actions tab UI."""
@@ -224,4 +250,5 @@ class ActionsTab(TabFrame):
     
     def set_json_output(self, json_text: str):
         """Set the JSON output text."""
+        self.ensure_ui()
         self.json_frame.set_json(json_text)
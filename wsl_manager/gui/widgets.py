@@ -3,36 +3,239 @@ Reusable GUI widgets and components.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, font as tkfont
 from typing import Callable, Optional, Dict, Any
-from .config import STYLES
+from .config import STYLES, SELECT_DEBOUNCE_DELAY
 
 
 class DistributionTreeView(ttk.Treeview):
-    """Custom TreeView for displaying WSL distributions."""
+    """Custom TreeView for displaying WSL distributions.
+    
+    Lists longer than VIRTUAL_THRESHOLD rows are virtualized: all rows are
+    kept in Python and only the ones that fit in the widget are inserted,
+    re-rendering the window as the view is scrolled or resized.
+    """
+    
+    VIRTUAL_THRESHOLD = 500
+    
+    # Tcl lambda inserting every row in one interpreter call, with ids
+    # numbered from the row's index in the full list (see _insert_rows)
+    _BULK_INSERT = '{w rows i} {foreach r $rows {$w insert {} end -id [incr i] -values $r}}'
+    
+    # Tcl lambda setting every column's heading and width in one call
+    _SETUP_COLUMNS = '{w specs} {foreach {c h wd} $specs {$w heading $c -text $h; $w column $c -width $wd}}'
     
     def __init__(self, parent, columns_config: Dict[str, Any], **kwargs):
+        self._all_rows = []
+        self._first = 0
+        self._yscrollcommand = None
+        # The constructor doesn't go through configure(), so hook this up after
+        yscrollcommand = kwargs.pop('yscrollcommand', None)
         super().__init__(parent, **kwargs)
+        if yscrollcommand:
+            self.configure(yscrollcommand=yscrollcommand)
         self.columns_config = columns_config
         self.setup_columns()
+        self.bind('<MouseWheel>', self._on_mousewheel, add='+')
+        self.bind('<Configure>', lambda event: self._render_window(), add='+')
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>'):
+            self.bind(key, self._on_navigation_key, add='+')
     
     def setup_columns(self):
         """Configure the treeview columns."""
         columns = self.columns_config['columns']
+        headings = self.columns_config['headings']
+        widths = self.columns_config['widths']
         self.configure(columns=columns, show='headings')
         
-        # Set up headings and column widths
-        for col in columns:
-            self.heading(col, text=self.columns_config['headings'][col])
-            self.column(col, width=self.columns_config['widths'][col])
+        # Set up headings and column widths in a single interpreter call
+        specs = tuple(value for col in columns for value in (col, headings[col], widths[col]))
+        self.tk.call('apply', self._SETUP_COLUMNS, self._w, specs)
+    
+    def configure(self, cnf=None, **kw):
+        """Configure the widget, routing scroll reports through the virtual view."""
+        if isinstance(cnf, dict):
+            kw = {**cnf, **kw}
+            cnf = None
+        if kw.get('yscrollcommand'):
+            self._yscrollcommand = kw['yscrollcommand']
+            kw['yscrollcommand'] = self._on_tk_yscroll
+        return super().configure(cnf, **kw)
+    
+    config = configure
+    
+    def __setitem__(self, key, value):
+        self.configure({key: value})
+    
+    def set_rows(self, rows):
+        """Replace all items with the given rows of column values.
+        
+        The rows are handed to Tcl in a single call rather than one insert()
+        per row, so large lists don't pay a Python/Tcl round trip per item.
+        When neither the old nor the new list is virtualized, only the rows
+        that changed are touched (see _update_rows).
+        """
+        old_rows = self._all_rows
+        was_virtual = self._is_virtual()
+        self._all_rows = [tuple(row) for row in rows]
+        self._first = 0
+        if self._is_virtual():
+            self._render_window()
+        elif was_virtual:
+            self._insert_rows(self._all_rows, 0)
+        else:
+            self._update_rows(old_rows, self._all_rows)
+    
+    def get_row(self, iid: str) -> tuple:
+        """Return the column values of an item without asking Tk for them.
+        
+        Item ids are the row's position in the full list (counting from 1).
+        """
+        return self._all_rows[int(iid) - 1]
+    
+    def add_row(self, row):
+        """Append one row of column values, inserting it in a single call."""
+        self._all_rows.append(tuple(row))
+        if self._is_virtual():
+            self._render_window()
+        else:
+            self.insert('', 'end', iid=str(len(self._all_rows)), values=self._all_rows[-1])
+    
+    def yview(self, *args):
+        """Query or change the vertical position, in terms of the full list."""
+        if not args or not self._is_virtual():
+            return super().yview(*args)
+        if args[0] == 'moveto':
+            self._first = int(float(args[1]) * len(self._all_rows))
+        elif args[0] == 'scroll':
+            step = self._visible_rows() if args[2] == 'pages' else 1
+            self._first += int(args[1]) * step
+        self._render_window()
+    
+    def _is_virtual(self) -> bool:
+        return len(self._all_rows) > self.VIRTUAL_THRESHOLD
+    
+    def _insert_rows(self, rows, first_index: int):
+        """Replace the items with rows, numbering their ids from first_index."""
+        children = self.get_children()
+        if children:
+            self.delete(*children)
+        if rows:
+            self.tk.call('apply', self._BULK_INSERT, self._w, tuple(rows), first_index)
+    
+    def _update_rows(self, old_rows, new_rows):
+        """Turn the items showing old_rows into new_rows, position by position.
+        
+        A refresh usually returns the same list, maybe with a state changed,
+        so unchanged items are left alone (keeping their selection), changed
+        ones are updated in place and only the tail is inserted or deleted.
+        
+        Item ids are positions, so the selection is kept by distribution
+        name (the first column): a selected row that moved stays selected at
+        its new position, and one that is gone is deselected.
+        """
+        selected = self.selection()
+        selected_names = {old_rows[int(iid) - 1][0] for iid in selected}
+        
+        common = min(len(old_rows), len(new_rows))
+        # Changed rows go straight to Tcl, skipping item()'s option handling
+        call, widget = self.tk.call, self._w
+        for index in range(common):
+            if old_rows[index] != new_rows[index]:
+                call(widget, 'item', index + 1, '-values', new_rows[index])
+        if len(old_rows) > common:
+            self.delete(*(str(index + 1) for index in range(common, len(old_rows))))
+        elif len(new_rows) > common:
+            self.tk.call('apply', self._BULK_INSERT, self._w, tuple(new_rows[common:]), common)
+        
+        if selected:
+            keep = tuple(str(index + 1) for index, row in enumerate(new_rows) if row[0] in selected_names)
+            # Setting the selection fires <<TreeviewSelect>>, so the buttons
+            # follow; skip it when nothing moved
+            if set(keep) != set(selected):
+                self.selection_set(keep)
+    
+    def _visible_rows(self) -> int:
+        """Number of rows that fit in the widget, less one for the headings."""
+        style = self.cget('style') or 'Treeview'
+        rowheight = int(ttk.Style(self).lookup(style, 'rowheight') or 20)
+        return max(1, self.winfo_height() // rowheight - 1)
+    
+    def _render_window(self):
+        """Insert the rows that are currently scrolled into view."""
+        if not self._is_virtual():
+            return
+        count = self._visible_rows()
+        self._first = max(0, min(self._first, len(self._all_rows) - count))
+        
+        selected = self.selection()
+        self._insert_rows(self._all_rows[self._first:self._first + count], self._first)
+        kept = [iid for iid in selected if self.exists(iid)]
+        if kept:
+            self.selection_set(kept)
+        self._report_scroll()
+    
+    def _report_scroll(self):
+        """Tell the scrollbar where the window sits within the full list."""
+        if self._yscrollcommand:
+            total = len(self._all_rows)
+            last = min(total, self._first + self._visible_rows())
+            self._yscrollcommand(self._first / total, last / total)
+    
+    def _on_tk_yscroll(self, first, last):
+        # Tk only knows about the inserted window, so report the virtual
+        # position instead while virtualized
+        if self._is_virtual():
+            self._report_scroll()
+        elif self._yscrollcommand:
+            self._yscrollcommand(first, last)
+    
+    def _on_mousewheel(self, event):
+        if not self._is_virtual():
+            return None
+        self.yview('scroll', -event.delta // 120, 'units')
+        return 'break'
+    
+    def _on_navigation_key(self, event):
+        # Tk's own key bindings stop at the edges of the inserted window, so
+        # move the focus through the full list and scroll it into view
+        if not self._is_virtual():
+            return None
+        count = self._visible_rows()
+        step = {'Up': -1, 'Down': 1, 'Prior': -count, 'Next': count}[event.keysym]
+        focus = self.focus()
+        index = int(focus) - 1 + step if focus else self._first
+        index = max(0, min(index, len(self._all_rows) - 1))
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + count:
+            self._first = index - count + 1
+        self._render_window()
+        
+        iid = str(index + 1)
+        self.focus(iid)
+        self.selection_set(iid)
+        self.see(iid)
+        return 'break'
 
 
 class ActionButtons(ttk.Frame):
     """Frame containing action buttons for distributions."""
     
+    # Button styles by button name
+    STYLE_MAPPING = {
+        'refresh': STYLES['primary_button'],
+        'install': STYLES['success_button'],
+        'rename': STYLES['secondary_button'],
+        'delete': STYLES['danger_button'],
+        'export': STYLES['primary_button'],
+        'help': STYLES['secondary_button']
+    }
+    
     def __init__(self, parent, button_configs: Dict[str, Dict[str, Any]], **kwargs):
         super().__init__(parent, **kwargs)
         self.buttons = {}
+        self.states = {}  # Last state set on each button, by name
         self.setup_buttons(button_configs)
     
     def setup_buttons(self, button_configs: Dict[str, Dict[str, Any]]):
@@ -57,32 +260,27 @@ class ActionButtons(ttk.Frame):
                 sticky=(tk.W, tk.E)
             )
             self.buttons[name] = button
+            self.states[name] = config.get('state', 'normal')
     
     def get_button_style(self, name: str, custom_style: Optional[str] = None) -> str:
         """Get the appropriate button style based on button name and purpose."""
         if custom_style:
             return custom_style
-        
-        # Map button names to styles
-        style_mapping = {
-            'refresh': STYLES['primary_button'],
-            'install': STYLES['success_button'],
-            'rename': STYLES['secondary_button'],
-            'delete': STYLES['danger_button'],
-            'export': STYLES['primary_button'],
-            'help': STYLES['secondary_button']
-        }
-        
-        return style_mapping.get(name, STYLES['primary_button'])
+        return self.STYLE_MAPPING.get(name, STYLES['primary_button'])
     
     def get_button(self, name: str) -> ttk.Button:
         """Get a button by name."""
         return self.buttons.get(name)
     
     def set_button_state(self, name: str, state: str):
-        """Set the state of a button."""
-        if name in self.buttons:
+        """Set the state of a button.
+        
+        Selection changes set the same state over and over, so the Tcl call
+        is skipped when the button already has it.
+        """
+        if name in self.buttons and self.states[name] != state:
             self.buttons[name].config(state=state)
+            self.states[name] = state
 
 
 class StatusBar(ttk.Label):
@@ -94,8 +292,9 @@ class StatusBar(ttk.Label):
         super().__init__(parent, textvariable=self.status_var, **kwargs)
     
     def set_status(self, message: str):
-        """Set the status message."""
-        self.status_var.set(message)
+        """Set the status message, leaving the label alone if it is unchanged."""
+        if message != self.status_var.get():
+            self.status_var.set(message)
     
     def get_status(self) -> str:
         """Get the current status message."""
@@ -112,8 +311,9 @@ class SummaryFrame(ttk.LabelFrame):
         ttk.Label(self, textvariable=self.summary_var).grid(row=0, column=0, sticky=tk.W)
     
     def set_summary(self, text: str):
-        """Set the summary text."""
-        self.summary_var.set(text)
+        """Set the summary text, leaving the label alone if it is unchanged."""
+        if text != self.summary_var.get():
+            self.summary_var.set(text)
     
     def get_summary(self) -> str:
         """Get the current summary text."""
@@ -121,24 +321,161 @@ class SummaryFrame(ttk.LabelFrame):
 
 
 class JSONOutputFrame(ttk.LabelFrame):
-    """Frame for displaying JSON output."""
+    """Frame for displaying JSON output.
+    
+    Outputs longer than PAGED_THRESHOLD lines are paged: the lines are kept
+    in Python and the text widget only holds the ones currently in view.
+    The keyboard scrolls through the whole output, and copying with the
+    whole page selected (Ctrl+A) copies the full text (see copy_all).
+    """
+    
+    # Characters inserted per idle callback when filling the text widget
+    CHUNK_SIZE = 64 * 1024
+    PAGED_THRESHOLD = 10000
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, text="JSON Output", padding="5", **kwargs)
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
         
-        self.json_text = scrolledtext.ScrolledText(self, height=15, width=80)
-        self.json_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # The text widget is only needed once something is exported, so it
+        # is created on first use (see _get_text)
+        self.json_text = None
+        self.scrollbar = None
+        self._feed_id = None
+        self._lines = []
+        self._first_line = 0
+        self.placeholder = ttk.Label(self, text="Use 'Export to JSON' to show the data here.")
+        self.placeholder.grid(row=0, column=0, sticky=tk.W)
+    
+    def _get_text(self) -> tk.Text:
+        """Return the text widget, creating it on first use."""
+        if self.json_text is None:
+            self.placeholder.destroy()
+            self.json_text = tk.Text(self, height=15, width=80)
+            self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
+            self.json_text.configure(yscrollcommand=self._on_text_yscroll)
+            self.json_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+            self.json_text.bind('<MouseWheel>', self._on_mousewheel)
+            self.json_text.bind('<Configure>', lambda event: self._render_page())
+            self.json_text.bind('<<Copy>>', self._on_copy)
+            for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Control-Home>', '<Control-End>'):
+                self.json_text.bind(key, self._on_navigation_key)
+        return self.json_text
+    
+    def _is_paged(self) -> bool:
+        return len(self._lines) > self.PAGED_THRESHOLD
     
     def set_json(self, json_text: str):
-        """Set the JSON text content."""
-        self.json_text.delete(1.0, tk.END)
-        self.json_text.insert(1.0, json_text)
+        """Set the JSON text content.
+        
+        Large texts are inserted in CHUNK_SIZE pieces from idle callbacks so
+        the event loop keeps running while the widget fills up.
+        """
+        text = self._get_text()
+        if self._feed_id is not None:
+            self.after_cancel(self._feed_id)
+            self._feed_id = None
+        self._lines = json_text.splitlines()
+        self._first_line = 0
+        if self._is_paged():
+            self._render_page()
+            return
+        
+        def feed(start):
+            end = start + self.CHUNK_SIZE
+            text.insert(tk.END, json_text[start:end])
+            self._feed_id = self.after_idle(feed, end) if end < len(json_text) else None
+        
+        # The first chunk replaces the old contents in a single command, so
+        # the widget is never redrawn empty in between
+        text.replace(1.0, tk.END, json_text[:self.CHUNK_SIZE])
+        if len(json_text) > self.CHUNK_SIZE:
+            self._feed_id = self.after_idle(feed, self.CHUNK_SIZE)
     
     def get_json(self) -> str:
         """Get the current JSON text content."""
+        if self.json_text is None:
+            return ""
+        if self._is_paged():
+            return "\n".join(self._lines)
         return self.json_text.get(1.0, tk.END).strip()
+    
+    def copy_all(self):
+        """Put the full JSON text on the clipboard, not just the shown page."""
+        self.clipboard_clear()
+        self.clipboard_append(self.get_json())
+    
+    def _visible_lines(self) -> int:
+        linespace = tkfont.Font(font=self.json_text.cget('font')).metrics('linespace')
+        return max(1, self.json_text.winfo_height() // linespace)
+    
+    def _render_page(self):
+        """Show the lines currently scrolled into view."""
+        if self.json_text is None or not self._is_paged():
+            return
+        count = self._visible_lines()
+        total = len(self._lines)
+        self._first_line = max(0, min(self._first_line, total - count))
+        self.json_text.replace(1.0, tk.END, "\n".join(self._lines[self._first_line:self._first_line + count]))
+        self.scrollbar.set(self._first_line / total, min(total, self._first_line + count) / total)
+    
+    def _yview(self, *args):
+        if not self._is_paged():
+            return self.json_text.yview(*args)
+        if args[0] == 'moveto':
+            self._first_line = int(float(args[1]) * len(self._lines))
+        elif args[0] == 'scroll':
+            step = self._visible_lines() if args[2] == 'pages' else 1
+            self._first_line += int(args[1]) * step
+        self._render_page()
+    
+    def _on_text_yscroll(self, first, last):
+        # While paged the scrollbar tracks the page, not the text widget
+        if not self._is_paged():
+            self.scrollbar.set(first, last)
+    
+    def _on_mousewheel(self, event):
+        if not self._is_paged():
+            return None
+        self._yview('scroll', -event.delta // 40, 'units')
+        return 'break'
+    
+    def _on_copy(self, event):
+        # The page is all the widget has, so a selection covering all of it
+        # stands for the whole output
+        if not self._is_paged() or not self.json_text.tag_ranges(tk.SEL):
+            return None
+        text = self.json_text
+        if text.compare(tk.SEL_FIRST, '==', 1.0) and text.compare(tk.SEL_LAST, '>=', 'end-1c'):
+            self.copy_all()
+            return 'break'
+        return None
+    
+    def _on_navigation_key(self, event):
+        # Tk's own bindings stop at the edges of the page, so scroll the page
+        # when the cursor would leave it and keep the cursor where it was
+        if not self._is_paged():
+            return None
+        text = self.json_text
+        line, column = map(int, text.index(tk.INSERT).split('.'))
+        last_line = int(text.index('end-1c').split('.')[0])
+        key = event.keysym
+        if event.state & 0x4 and key in ('Home', 'End'):  # Control held
+            self._yview('moveto', 0 if key == 'Home' else 1)
+            line, column = (1, 0) if key == 'Home' else (last_line, 'end')
+        elif key in ('Prior', 'Next'):
+            self._yview('scroll', -1 if key == 'Prior' else 1, 'pages')
+        elif key == 'Up' and line == 1:
+            self._yview('scroll', -1, 'units')
+        elif key == 'Down' and line == last_line:
+            self._yview('scroll', 1, 'units')
+        else:
+            return None
+        text.mark_set(tk.INSERT, f"{line}.{column}")
+        text.see(tk.INSERT)
+        return 'break'
 
 
 class HeaderFrame(ttk.Frame):
@@ -157,7 +494,11 @@ class HeaderFrame(ttk.Frame):
 
 
 class TabFrame(ttk.Frame):
-    """Base frame for tab content."""
+    """Base frame for tab content.
+    
+    Subclasses build their widgets in setup_ui(), which ensure_ui() runs on
+    first use, so tabs that aren't shown yet don't pay for their widgets.
+    """
     
     def __init__(self, parent, **kwargs):
         # Use standard frame styling with white background
@@ -166,6 +507,28 @@ class TabFrame(ttk.Frame):
         self.columnconfigure(1, weight=0)  # Scrollbar column fixed width
         self.columnconfigure(2, weight=0)  # Action buttons column fixed width
         self.rowconfigure(1, weight=1)
+        self._debounce_id = None
+        self.ui_ready = False
+    
+    def setup_ui(self):
+        """Create the tab's widgets."""
+    
+    def ensure_ui(self):
+        """Create the tab's widgets if that hasn't happened yet."""
+        if not self.ui_ready:
+            self.ui_ready = True
+            self.setup_ui()
+    
+    def debounce(self, callback: Callable[[], None]):
+        """Run callback after SELECT_DEBOUNCE_DELAY ms, replacing any pending one."""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+        
+        def run():
+            self._debounce_id = None
+            callback()
+        
+        self._debounce_id = self.after(SELECT_DEBOUNCE_DELAY, run)
     
     def setup_header(self, title: str, buttons: Optional[ActionButtons] = None):
         """Set up the header with title and buttons."""
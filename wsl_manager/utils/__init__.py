@@ -5,9 +5,10 @@ This module contains utility functions for subprocess management and other
 common operations.
 """
 
-from .subprocess_utils import run_wsl_command, run_command_silent
+from .subprocess_utils import run_wsl_command, run_command_silent, pipe_wsl_commands
 
 __all__ = [
     "run_wsl_command",
     "run_command_silent",
+    "pipe_wsl_commands",
 ]
@@ -15,6 +15,7 @@ def run_wsl_command(
     capture_output: bool = True, 
     check: bool = True,
     text: bool = False,
+    discard_stdout: bool = False,
     **kwargs
 ) -> subprocess.CompletedProcess:
     """
@@ -25,6 +26,8 @@ def run_wsl_command(
         capture_output: Whether to capture stdout/stderr
         check: Whether to raise exception on non-zero exit code
         text: Whether to return text instead of bytes
+        discard_stdout: Whether to send stdout to DEVNULL, capturing only stderr
+            (for commands whose output isn't used)
         **kwargs: Additional arguments for subprocess.run
     
     Returns:
@@ -34,6 +37,10 @@ def run_wsl_command(
     if sys.platform == "win32":
         kwargs.setdefault('creationflags', subprocess.CREATE_NO_WINDOW)
     
+    if discard_stdout:
+        capture_output = False
+        kwargs.update(stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    
     return subprocess.run(
         args,
         capture_output=capture_output,
@@ -77,3 +84,58 @@ def run_command_silent(
         text=text,
         **kwargs
     )
+
+
+def pipe_wsl_commands(
+    source_args: List[str],
+    sink_args: List[str],
+    **kwargs
+) -> subprocess.CompletedProcess:
+    """
+    Run two WSL commands with the first one's output piped into the second,
+    like 'source | sink' in a shell, with console window suppression on Windows.
+    
+    Args:
+        source_args: Arguments of the command writing to the pipe
+        sink_args: Arguments of the command reading from the pipe
+        **kwargs: Additional arguments for subprocess.Popen
+    
+    Returns:
+        CompletedProcess object for the sink command (stdout/stderr as bytes)
+    
+    Raises:
+        subprocess.CalledProcessError: If either command exits non-zero
+    """
+    # Add Windows-specific flags to suppress console window
+    if sys.platform == "win32":
+        kwargs.setdefault('creationflags', subprocess.CREATE_NO_WINDOW)
+    
+    import tempfile  # Only needed for copying distributions
+    
+    # The source's stderr goes to a file so it can't fill up and block the
+    # source while only the sink is being read
+    with tempfile.TemporaryFile() as source_stderr:
+        source = subprocess.Popen(source_args, stdout=subprocess.PIPE, stderr=source_stderr, **kwargs)
+        try:
+            sink = subprocess.Popen(sink_args, stdin=source.stdout, stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE, **kwargs)
+        except BaseException:
+            source.kill()
+            source.wait()
+            raise
+        finally:
+            # Only the sink holds the pipe now, so the source sees it close
+            # if the sink exits early
+            source.stdout.close()
+        
+        stdout, stderr = sink.communicate()
+        source.wait()
+        
+        if source.returncode:
+            source_stderr.seek(0)
+            raise subprocess.CalledProcessError(source.returncode, source_args,
+                                                stderr=source_stderr.read())
+    
+    if sink.returncode:
+        raise subprocess.CalledProcessError(sink.returncode, sink_args, stdout, stderr)
+    return subprocess.CompletedProcess(sink_args, sink.returncode, stdout, stderr)